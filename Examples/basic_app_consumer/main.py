@@ -7,7 +7,11 @@ MASSIR_ROOT = Path(__file__).parent.parent.parent.resolve()
 CURRENT_ROOT = Path(__file__).parent.resolve()
 sys.path.insert(0, str(MASSIR_ROOT))
 
-from massir import App
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 async def main():
@@ -17,6 +21,9 @@ async def main():
     This function initializes and runs the Massir application with a single
     application module that demonstrates basic module functionality.
     """
+    # Imported here so the framework loads only when the app actually runs
+    from massir import App
+
     # Initial settings with higher priority than JSON configuration
     # If defined in JSON, this value will override it
     initial_settings = {
@@ -48,7 +55,17 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    # One explicit loop for the whole process; cleaned up on exit
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     try:
-        asyncio.run(main())
+        loop.run_until_complete(main())
     except KeyboardInterrupt:
         pass
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        asyncio.set_event_loop(None)
+        loop.close()
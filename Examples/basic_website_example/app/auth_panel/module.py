@@ -4,18 +4,117 @@ Auth Panel Module - Login and user panel.
 This module provides login and user panel functionality.
 Login with admin/12345 for testing.
 """
+import hashlib
+import hmac
+import secrets
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Optional
 from massir.core.interfaces import IModule
 
 
-# Simple user database for demo
-USERS = {
-    "admin": {
-        "password": "12345",
-        "name": "Administrator",
-        "email": "admin@example.com",
-        "role": "admin"
+# PBKDF2 work factor for stored password hashes
+PASSWORD_ITERATIONS = 200_000
+
+# Maximum number of remembered successful logins
+VERIFIED_LOGINS_MAX = 1024
+
+
+def _hash_password(password: str, salt: bytes) -> bytes:
+    """Derive the stored hash for a password."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PASSWORD_ITERATIONS)
+
+
+def _make_user(password: str, **fields) -> dict:
+    """Build a user record with a salted password hash."""
+    salt = secrets.token_bytes(16)
+    return {
+        "password_salt": salt,
+        "password_hash": _hash_password(password, salt),
+        **fields
     }
-}
+
+
+# Simple user database for demo (read-only after import)
+USERS = MappingProxyType({
+    "admin": _make_user(
+        "12345",
+        name="Administrator",
+        email="admin@example.com",
+        role="admin"
+    )
+})
+
+# Known usernames, checked before any user record is touched
+USERNAMES = frozenset(USERS)
+
+# Stand-in salt and hash checked for unknown usernames, so they cost the
+# same key derivation as a wrong password and do not reveal valid names
+_DUMMY_SALT = secrets.token_bytes(16)
+_DUMMY_HASH = _hash_password(secrets.token_hex(16), _DUMMY_SALT)
+
+# Keyed digest of (username, password) -> password hash it was verified
+# against. Repeated logins skip the key derivation; no plaintext is kept.
+_LOGIN_CACHE_KEY = secrets.token_bytes(32)
+_verified_logins: Dict[bytes, bytes] = {}
+
+
+def _verify_credentials(username: str, password: str) -> Optional[dict]:
+    """
+    Check a username and password.
+    
+    Args:
+        username: Submitted username
+        password: Submitted password
+    
+    Returns:
+        The user record if the credentials are valid, otherwise None
+    """
+    if username not in USERNAMES:
+        hmac.compare_digest(_hash_password(password, _DUMMY_SALT), _DUMMY_HASH)
+        return None
+    
+    user = USERS[username]
+    password_hash = user["password_hash"]
+    key = hashlib.blake2b(
+        f"{username}:{password}".encode(),
+        key=_LOGIN_CACHE_KEY,
+        digest_size=16
+    ).digest()
+    cached_hash = _verified_logins.get(key)
+    if cached_hash is not None and hmac.compare_digest(cached_hash, password_hash):
+        return user
+    
+    candidate = _hash_password(password, user["password_salt"])
+    if not hmac.compare_digest(candidate, password_hash):
+        return None
+    
+    if len(_verified_logins) >= VERIFIED_LOGINS_MAX:
+        _verified_logins.clear()
+    _verified_logins[key] = password_hash
+    return user
+
+
+@dataclass(frozen=True, slots=True)
+class LoginForm:
+    """Typed fields of the login form."""
+    username: str = ""
+    password: str = ""
+    
+    @classmethod
+    async def parse(cls, request) -> "LoginForm":
+        """Parse the submitted form of a request."""
+        form_data = await request.form()
+        return cls(form_data.get("username", ""), form_data.get("password", ""))
+
+
+# Route table: (path, HTTP methods, handler method name)
+ROUTES = (
+    ("/login", ["GET"], "login_page"),
+    ("/login", ["POST"], "login_post"),
+    ("/logout", ["GET"], "logout"),
+    ("/panel", ["GET"], "panel"),
+)
 
 
 class AuthPanelModule(IModule):
@@ -29,15 +128,25 @@ class AuthPanelModule(IModule):
     
     def __init__(self):
         self.http_api = None
+        self.router_api = None
         self.template_service = None
         self.logger = None
+        self.Request = None
+        self.HTMLResponse = None
+        self.RedirectResponse = None
     
     async def load(self, context):
         """Get APIs from services."""
         self.http_api = context.services.get("http_api")
+        self.router_api = context.services.get("router_api")
         self.template_service = context.services.get("template_service")
         self.logger = context.services.get("core_logger")
         
+        # Resolve response/request types once instead of per request
+        self.Request = self.http_api.Request
+        self.HTMLResponse = self.http_api.HTMLResponse
+        self.RedirectResponse = self.http_api.RedirectResponse
+        
         if self.logger:
             self.logger.log("AuthPanel module loaded", tag="auth")
     
@@ -46,112 +155,94 @@ class AuthPanelModule(IModule):
         
         # Register menu items with template service
         if self.template_service:
-            # Login link - only visible when NOT logged in
-            self.template_service.register_menu_item(
-                label="Login",
-                url="/login",
-                order=900,  # Appears near the end
-                require_no_auth=True,
-                module_name=self.name
-            )
-            
-            # Panel link - only visible when logged in
-            self.template_service.register_menu_item(
-                label="Panel",
-                url="/panel",
-                order=500,
-                require_auth=True,
-                module_name=self.name
-            )
-            
-            # Logout link - only visible when logged in
-            self.template_service.register_menu_item(
-                label="Logout",
-                url="/logout",
-                order=999,  # Appears last
-                require_auth=True,
-                module_name=self.name
-            )
+            self.template_service.register_menu_items([
+                # Login link - only visible when NOT logged in, near the end
+                {"label": "Login", "url": "/login", "order": 900,
+                 "require_no_auth": True, "module_name": self.name},
+                # Panel link - only visible when logged in
+                {"label": "Panel", "url": "/panel", "order": 500,
+                 "require_auth": True, "module_name": self.name},
+                # Logout link - only visible when logged in, appears last
+                {"label": "Logout", "url": "/logout", "order": 999,
+                 "require_auth": True, "module_name": self.name},
+            ])
         
-        # GET /login - Login page
-        @self.http_api.get("/login", response_class=self.http_api.HTMLResponse)
-        async def login_page(request: self.http_api.Request):
-            """Login page."""
-            # Check if already logged in
-            current_user = request.session.get("user") if hasattr(request, "session") else None
-            if current_user:
-                return self.http_api.RedirectResponse(url="/panel", status_code=302)
-            
-            html = await self.template_service.render(
-                "login.html",
-                current_user=None
-            )
-            return self.http_api.HTMLResponse(content=html)
+        # Collect the bound handlers on one router and include it once
+        router = self.router_api.create()
+        for path, methods, handler_name in ROUTES:
+            router.add_route(path, getattr(self, handler_name), methods=methods, include_in_schema=False)
+        self.http_api.include_router(router)
         
-        # POST /login - Handle login
-        @self.http_api.post("/login", response_class=self.http_api.HTMLResponse)
-        async def login_post(request: self.http_api.Request):
-            """Handle login form submission."""
-            form_data = await request.form()
-            username = form_data.get("username", "")
-            password = form_data.get("password", "")
-            
-            # Check credentials
-            user = USERS.get(username)
-            if user and user["password"] == password:
-                # Set session
-                if hasattr(request, "session"):
-                    request.session["user"] = {
-                        "username": username,
-                        "name": user["name"],
-                        "email": user["email"],
-                        "role": user["role"]
-                    }
-                
-                if self.logger:
-                    self.logger.log(f"User '{username}' logged in", tag="auth")
-                
-                return self.http_api.RedirectResponse(url="/panel", status_code=302)
-            else:
-                if self.logger:
-                    self.logger.log(f"Failed login attempt for '{username}'", level="WARNING", tag="auth")
-                
-                html = await self.template_service.render(
-                    "login.html",
-                    current_user=None,
-                    error=True
-                )
-                return self.http_api.HTMLResponse(content=html)
+        if self.logger:
+            self.logger.log("Auth panel routes registered", tag="auth")
+    
+    async def login_page(self, request):
+        """GET /login - Login page."""
+        # Check if already logged in
+        current_user = self.template_service.get_current_user(request)
+        if current_user:
+            return self.RedirectResponse(url="/panel", status_code=302)
         
-        # GET /logout - Logout
-        @self.http_api.get("/logout")
-        async def logout(request: self.http_api.Request):
-            """Logout user."""
-            if hasattr(request, "session"):
-                user = request.session.get("user")
-                if user and self.logger:
-                    self.logger.log(f"User '{user.get('username')}' logged out", tag="auth")
-                request.session.clear()
-            
-            return self.http_api.RedirectResponse(url="/", status_code=302)
+        html = await self.template_service.render(
+            "login.html",
+            current_user=None
+        )
+        return self.HTMLResponse(content=html)
+    
+    async def login_post(self, request):
+        """POST /login - Handle login form submission."""
+        form = await LoginForm.parse(request)
+        username = form.username
         
-        # GET /panel - User panel
-        @self.http_api.get("/panel", response_class=self.http_api.HTMLResponse)
-        async def panel(request: self.http_api.Request):
-            """User panel page."""
-            current_user = request.session.get("user") if hasattr(request, "session") else None
+        # Check credentials
+        user = _verify_credentials(username, form.password)
+        if user:
+            # Set session
+            if self.template_service.sessions_enabled:
+                request.session["user"] = {
+                    "username": username,
+                    "name": user["name"],
+                    "email": user["email"],
+                    "role": user["role"]
+                }
+            
+            if self.logger and self.logger.enabled_for("INFO", "auth"):
+                self.logger.log(f"User '{username}' logged in", tag="auth")
             
-            if not current_user:
-                return self.http_api.RedirectResponse(url="/login", status_code=302)
+            return self.RedirectResponse(url="/panel", status_code=302)
+        else:
+            if self.logger and self.logger.enabled_for("WARNING", "auth"):
+                self.logger.log(f"Failed login attempt for '{username}'", level="WARNING", tag="auth")
             
             html = await self.template_service.render(
-                "panel.html",
-                current_user=current_user
+                "login.html",
+                current_user=None,
+                error=True
             )
-            return self.http_api.HTMLResponse(content=html)
+            return self.HTMLResponse(content=html)
+    
+    async def logout(self, request):
+        """GET /logout - Logout user."""
+        if self.template_service.sessions_enabled:
+            user = self.template_service.get_current_user(request)
+            if user and self.logger and self.logger.enabled_for("INFO", "auth"):
+                self.logger.log(f"User '{user.get('username')}' logged out", tag="auth")
+            request.session.clear()
         
-        if self.logger:
-            self.logger.log("Auth panel routes registered", tag="auth")
+        return self.RedirectResponse(url="/", status_code=302)
+    
+    async def panel(self, request):
+        """GET /panel - User panel page."""
+        current_user = self.template_service.get_current_user(request)
+        
+        if not current_user:
+            return self.RedirectResponse(url="/login", status_code=302)
+        
+        html = await self.template_service.render(
+            "panel.html",
+            current_user=current_user
+        )
+        return self.HTMLResponse(content=html)
     
     async def stop(self, context):
         """Cleanup resources and unregister menu items."""
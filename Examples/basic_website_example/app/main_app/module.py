@@ -3,10 +3,37 @@ Main App Module - Main website pages.
 
 This module provides the main website pages: index, about, contact.
 """
-from pathlib import Path
+from dataclasses import dataclass
 from massir.core.interfaces import IModule
 
 
+@dataclass(frozen=True, slots=True)
+class ContactForm:
+    """Typed fields of the contact form."""
+    name: str = ""
+    email: str = ""
+    message: str = ""
+    
+    @classmethod
+    async def parse(cls, request) -> "ContactForm":
+        """Parse the submitted form of a request."""
+        form_data = await request.form()
+        return cls(
+            form_data.get("name", ""),
+            form_data.get("email", ""),
+            form_data.get("message", "")
+        )
+
+
+# Route table: (path, HTTP methods, handler method name)
+ROUTES = (
+    ("/", ["GET"], "index"),
+    ("/about", ["GET"], "about"),
+    ("/contact", ["GET"], "contact"),
+    ("/contact", ["POST"], "contact_post"),
+)
+
+
 class MainAppModule(IModule):
     """
     Main app module.
@@ -18,14 +45,26 @@ class MainAppModule(IModule):
     
     def __init__(self):
         self.http_api = None
+        self.router_api = None
         self.template_service = None
         self.logger = None
+        self.config = None
+        self.Request = None
+        self.HTMLResponse = None
+        self.RedirectResponse = None
     
     async def load(self, context):
         """Get APIs from services."""
         self.http_api = context.services.get("http_api")
+        self.router_api = context.services.get("router_api")
         self.template_service = context.services.get("template_service")
         self.logger = context.services.get("core_logger")
+        self.config = context.services.get("core_config")
+        
+        # Resolve response/request types once instead of per request
+        self.Request = self.http_api.Request
+        self.HTMLResponse = self.http_api.HTMLResponse
+        self.RedirectResponse = self.http_api.RedirectResponse
         
         if self.logger:
             self.logger.log("MainApp module loaded", tag="main_app")
@@ -33,91 +72,77 @@ class MainAppModule(IModule):
     async def start(self, context):
         """Register main website routes and menu items."""
         
-        # Register menu items with template service
-        if self.template_service:
-            # Home - first item, always visible
-            self.template_service.register_menu_item(
-                label="Home",
-                url="/",
-                order=10,  # First item
-                module_name=self.name
-            )
-            
-            # About page
-            self.template_service.register_menu_item(
-                label="About",
-                url="/about",
-                order=100,
-                module_name=self.name
-            )
-            
-            # Contact page
-            self.template_service.register_menu_item(
-                label="Contact",
-                url="/contact",
-                order=200,
-                module_name=self.name
-            )
-        
-        # GET / - Home page
-        @self.http_api.get("/", response_class=self.http_api.HTMLResponse)
-        async def index(request: self.http_api.Request):
-            """Home page."""
-            current_user = request.session.get("user") if hasattr(request, "session") else None
-            html = await self.template_service.render(
-                "index.html",
-                current_user=current_user
-            )
-            return self.http_api.HTMLResponse(content=html)
+        # Register menu items with template service (main_app.register_menu, default on)
+        register_menu = self.config.get("main_app.register_menu") if self.config else None
+        if self.template_service and register_menu is not False:
+            self.template_service.register_menu_items([
+                # Home - first item, always visible
+                {"label": "Home", "url": "/", "order": 10, "module_name": self.name},
+                {"label": "About", "url": "/about", "order": 100, "module_name": self.name},
+                {"label": "Contact", "url": "/contact", "order": 200, "module_name": self.name},
+            ])
         
-        # GET /about - About page
-        @self.http_api.get("/about", response_class=self.http_api.HTMLResponse)
-        async def about(request: self.http_api.Request):
-            """About page."""
-            current_user = request.session.get("user") if hasattr(request, "session") else None
-            html = await self.template_service.render(
-                "about.html",
-                current_user=current_user
-            )
-            return self.http_api.HTMLResponse(content=html)
+        # Collect the bound handlers on one router and include it once
+        router = self.router_api.create()
+        for path, methods, handler_name in ROUTES:
+            router.add_route(path, getattr(self, handler_name), methods=methods, include_in_schema=False)
+        self.http_api.include_router(router)
         
-        # GET /contact - Contact page
-        @self.http_api.get("/contact", response_class=self.http_api.HTMLResponse)
-        async def contact(request: self.http_api.Request):
-            """Contact page."""
-            current_user = request.session.get("user") if hasattr(request, "session") else None
-            html = await self.template_service.render(
-                "contact.html",
-                current_user=current_user
-            )
-            return self.http_api.HTMLResponse(content=html)
+        if self.logger:
+            self.logger.log("Main app routes registered", tag="main_app")
+    
+    async def index(self, request):
+        """GET / - Home page."""
+        current_user = self.template_service.get_current_user(request)
+        if current_user is None:
+            return self.HTMLResponse(content=await self.template_service.render_cached_anon("index.html"))
+        html = await self.template_service.render(
+            "index.html",
+            current_user=current_user
+        )
+        return self.HTMLResponse(content=html)
+    
+    async def about(self, request):
+        """GET /about - About page."""
+        current_user = self.template_service.get_current_user(request)
+        if current_user is None:
+            return self.HTMLResponse(content=await self.template_service.render_cached_anon("about.html"))
+        html = await self.template_service.render(
+            "about.html",
+            current_user=current_user
+        )
+        return self.HTMLResponse(content=html)
+    
+    async def contact(self, request):
+        """GET /contact - Contact page."""
+        current_user = self.template_service.get_current_user(request)
+        if current_user is None:
+            return self.HTMLResponse(content=await self.template_service.render_cached_anon("contact.html"))
+        html = await self.template_service.render(
+            "contact.html",
+            current_user=current_user
+        )
+        return self.HTMLResponse(content=html)
+    
+    async def contact_post(self, request):
+        """POST /contact - Handle contact form submission."""
+        form = await ContactForm.parse(request)
         
-        # POST /contact - Handle contact form
-        @self.http_api.post("/contact", response_class=self.http_api.HTMLResponse)
-        async def contact_post(request: self.http_api.Request):
-            """Handle contact form submission."""
-            form_data = await request.form()
-            name = form_data.get("name", "")
-            email = form_data.get("email", "")
-            message = form_data.get("message", "")
-            
-            if self.logger:
-                self.logger.log(
-                    f"Contact form submitted: name={name}, email={email}",
-                    tag="main_app"
-                )
-            
-            current_user = request.session.get("user") if hasattr(request, "session") else None
-            html = await self.template_service.render(
-                "contact.html",
-                current_user=current_user,
-                success=True,
-                submitted_name=name
+        # Only build the message when it will actually be emitted
+        if self.logger and self.logger.enabled_for("INFO", "main_app"):
+            self.logger.log(
+                f"Contact form submitted: name={form.name}, email={form.email}",
+                tag="main_app"
             )
-            return self.http_api.HTMLResponse(content=html)
         
-        if self.logger:
-            self.logger.log("Main app routes registered", tag="main_app")
+        current_user = self.template_service.get_current_user(request)
+        html = await self.template_service.render(
+            "contact.html",
+            current_user=current_user,
+            success=True,
+            submitted_name=form.name
+        )
+        return self.HTMLResponse(content=html)
     
     async def stop(self, context):
         """Cleanup resources and unregister menu items."""
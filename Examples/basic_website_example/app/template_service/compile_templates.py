@@ -0,0 +1,35 @@
+"""
+Precompile the website templates into Python modules.
+
+TemplateService loads templates from the ``compiled`` directory when it
+exists, skipping template parsing and compilation entirely. Run this as
+a build step for deployments where templates do not change:
+
+    python compile_templates.py
+
+Delete the ``compiled`` directory (or re-run this script) after editing
+templates, otherwise the old versions keep being served.
+"""
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+MODULE_DIR = Path(__file__).parent
+TEMPLATES_DIR = MODULE_DIR / "templates"
+COMPILED_DIR = MODULE_DIR / "compiled"
+
+
+def main():
+    """Compile every template into COMPILED_DIR."""
+    # Must match the autoescape settings of TemplateService, since the
+    # escaping decision is baked into the compiled code
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=select_autoescape(['html', 'xml'])
+    )
+    env.compile_templates(str(COMPILED_DIR), zip=None, ignore_errors=False)
+    print(f"Compiled templates written to {COMPILED_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,53 @@ Template Service Module - Provides Jinja2 template rendering.
 This module provides template rendering service with themes and CSS
 for other modules to use. Also provides menu registration for dynamic navigation.
 """
+import os
+from bisect import insort
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, List, Tuple
 from massir.core.interfaces import IModule
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+# Module paths, resolved once at import time
+MODULE_DIR = Path(__file__).parent
+TEMPLATES_DIR = MODULE_DIR / "templates"
+STATIC_DIR = MODULE_DIR / "static"
+
+
+# User of the request being handled, set by TemplateService.get_current_user
+CURRENT_USER: ContextVar[Optional[dict]] = ContextVar("current_user", default=None)
+
+# Menu sort key: order, then label for consistent ordering
+MENU_SORT_KEY = attrgetter("order", "label")
+
+# Menu item visibility bits
+ANON_VISIBLE = 1
+AUTH_VISIBLE = 2
+
+
+@lru_cache(maxsize=256)
+def url_for_static(filename: str) -> str:
+    """Generate URL for static file (filenames come from a small, fixed set)."""
+    return f"/static/{filename}"
+
 
 class MenuItem:
     """
     Represents a menu item in the navigation.
     """
     
+    __slots__ = (
+        "label", "url", "order", "require_auth", "require_no_auth",
+        "module_name", "_dict", "_mask"
+    )
+    
     def __init__(
         self,
         label: str,
@@ -41,6 +77,17 @@ class MenuItem:
         self.require_auth = require_auth
         self.require_no_auth = require_no_auth
         self.module_name = module_name
+        # Visibility bits: ANON_VISIBLE when logged out, AUTH_VISIBLE when logged in
+        self._mask = (0 if require_auth else ANON_VISIBLE) | (0 if require_no_auth else AUTH_VISIBLE)
+        # Items are immutable once registered, so build the template dict once
+        self._dict = {
+            "label": label,
+            "url": url,
+            "order": order,
+            "require_auth": require_auth,
+            "require_no_auth": require_no_auth,
+            "module_name": module_name
+        }
     
     def is_visible(self, current_user: Optional[dict] = None) -> bool:
         """
@@ -52,22 +99,15 @@ class MenuItem:
         Returns:
             True if the item should be visible
         """
-        if self.require_auth and not current_user:
-            return False
-        if self.require_no_auth and current_user:
-            return False
-        return True
+        return bool(self._mask & (AUTH_VISIBLE if current_user else ANON_VISIBLE))
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for template rendering."""
-        return {
-            "label": self.label,
-            "url": self.url,
-            "order": self.order,
-            "require_auth": self.require_auth,
-            "require_no_auth": self.require_no_auth,
-            "module_name": self.module_name
-        }
+        """
+        Convert to dictionary for template rendering.
+        
+        Returns the same shared dict on every call; do not modify it.
+        """
+        return self._dict
 
 
 class MenuRegistry:
@@ -82,6 +122,13 @@ class MenuRegistry:
     def __init__(self):
         """Initialize the menu registry."""
         self._items: Dict[str, MenuItem] = {}
+        # Items ordered by (order, label), maintained on register/unregister
+        self._sorted: List[MenuItem] = []
+        # Bumped on every change; cached menus are keyed by (logged in, version)
+        self._version = 0
+        self._cache: Dict[Tuple[bool, int], List[dict]] = {}
+        # Nesting depth of batch() blocks; invalidation waits until it is 0
+        self._batch_depth = 0
     
     def register(
         self,
@@ -115,7 +162,12 @@ class MenuRegistry:
             require_no_auth=require_no_auth,
             module_name=module_name
         )
+        previous = self._items.get(key)
+        if previous is not None:
+            self._sorted.remove(previous)
         self._items[key] = item
+        insort(self._sorted, item, key=MENU_SORT_KEY)
+        self._invalidate()
         return key
     
     def unregister(self, key: str = None, module_name: str = None):
@@ -127,15 +179,41 @@ class MenuRegistry:
             module_name: Unregister all items from this module
         """
         if key:
-            self._items.pop(key, None)
+            item = self._items.pop(key, None)
+            if item is not None:
+                self._sorted.remove(item)
         elif module_name:
-            # Remove all items from this module
-            keys_to_remove = [
-                k for k, item in self._items.items()
-                if item.module_name == module_name
-            ]
-            for k in keys_to_remove:
-                self._items.pop(k, None)
+            # Remove all items from this module in one pass
+            self._items = {
+                k: item for k, item in self._items.items()
+                if item.module_name != module_name
+            }
+            self._sorted = [item for item in self._sorted if item.module_name != module_name]
+        self._invalidate()
+    
+    @contextmanager
+    def batch(self) -> Iterator["MenuRegistry"]:
+        """
+        Group several changes so cached menus are invalidated once.
+        
+        Usage:
+            with registry.batch():
+                registry.register("Home", "/")
+                registry.register("About", "/about")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._invalidate()
+    
+    def _invalidate(self):
+        """Drop cached menus after the registry changed."""
+        if self._batch_depth:
+            return
+        self._version += 1
+        self._cache.clear()
     
     def get_items(self, current_user: Optional[dict] = None) -> List[dict]:
         """
@@ -145,15 +223,16 @@ class MenuRegistry:
             current_user: Current logged-in user (None if not logged in)
         
         Returns:
-            List of visible menu item dictionaries, sorted by order
+            List of visible menu item dictionaries, sorted by order.
+            The list is shared between requests and must not be modified.
         """
-        visible_items = [
-            item for item in self._items.values()
-            if item.is_visible(current_user)
-        ]
-        # Sort by order, then by label for consistent ordering
-        sorted_items = sorted(visible_items, key=lambda x: (x.order, x.label))
-        return [item.to_dict() for item in sorted_items]
+        key = (bool(current_user), self._version)
+        items = self._cache.get(key)
+        if items is None:
+            bit = AUTH_VISIBLE if key[0] else ANON_VISIBLE
+            items = [item._dict for item in self._sorted if item._mask & bit]
+            self._cache[key] = items
+        return items
     
     def get_all_items(self) -> List[MenuItem]:
         """Get all registered menu items (for debugging)."""
@@ -178,38 +257,116 @@ class TemplateService:
         self.templates_dir = templates_dir
         self.static_dir = static_dir
         self.menu_registry = MenuRegistry()
+        # Set by TemplateServiceModule.start once the middleware stack is known
+        self.sessions_enabled = False
+        self._templates: Dict[str, "Template"] = {}
+        # Encoded pages rendered for anonymous visitors
+        self._anon_pages: Dict[str, bytes] = {}
+        
+        # Jinja2 environment, built on first render
+        self.env: Optional["Environment"] = None
+    
+    def _ensure_env(self) -> "Environment":
+        """Import Jinja2 and build the environment on first use."""
+        if self.env is not None:
+            return self.env
+        
+        from jinja2 import (
+            ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader,
+            ModuleLoader, select_autoescape
+        )
+        
+        loader = FileSystemLoader(str(self.templates_dir))
+        # Prefer precompiled template modules (see compile_templates.py),
+        # falling back to the sources for anything not compiled
+        compiled_dir = self.templates_dir.parent / "compiled"
+        if compiled_dir.is_dir():
+            loader = ChoiceLoader([ModuleLoader(str(compiled_dir)), loader])
         
-        # Create Jinja2 environment
+        # Bytecode of source templates is kept on disk so restarts and extra
+        # workers load it instead of re-parsing every template. Installs
+        # where the package directory is read-only render without it.
+        bytecode_cache = None
+        cache_dir = self.templates_dir.parent / ".jinja_cache"
+        try:
+            cache_dir.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        else:
+            if os.access(cache_dir, os.W_OK):
+                bytecode_cache = FileSystemBytecodeCache(str(cache_dir), '%s.cache')
+        
+        # Templates ship with the module, so skip the per-render mtime
+        # check and never evict compiled templates. Templates never await
+        # anything, so they are compiled in (faster) sync mode.
         self.env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
+            loader=loader,
             autoescape=select_autoescape(['html', 'xml']),
-            enable_async=True
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache
         )
         
         # Add global functions
-        self.env.globals['url_for_static'] = self._url_for_static
+        self.env.globals['url_for_static'] = url_for_static
+        return self.env
+    
+    def _get_template(self, template_name: str) -> "Template":
+        """Get a compiled template, loading it on first use."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._ensure_env().get_template(template_name)
+            self._templates[template_name] = template
+        return template
     
-    def _url_for_static(self, filename: str) -> str:
-        """Generate URL for static file."""
-        return f"/static/{filename}"
+    def _render(self, template_name: str, context: Dict[str, Any]) -> str:
+        """Add the current user and menu items to a context dict and render."""
+        # Callers may pass current_user explicitly; otherwise use the one
+        # resolved earlier in this request
+        if 'current_user' not in context:
+            context['current_user'] = CURRENT_USER.get()
+        context['menu_items'] = self.menu_registry.get_items(context['current_user'])
+        
+        # Hand the dict over as-is; Jinja copies it into its own context
+        # and layers env.globals underneath, so unpacking it again would
+        # only build a second throwaway dict.
+        return self._get_template(template_name).render(context)
     
     async def render(self, template_name: str, **context) -> str:
         """
         Render a template with context.
         
+        Rendering is CPU-bound and runs inline; the method stays async
+        so existing callers keep awaiting it.
+        
         Args:
             template_name: Name of template file
-            **context: Template context variables
+            **context: Template context variables (current_user defaults
+                to the user bound to this request)
         
         Returns:
             Rendered HTML string
         """
-        # Add menu items to context
-        current_user = context.get('current_user')
-        context['menu_items'] = self.menu_registry.get_items(current_user)
+        return self._render(template_name, context)
+    
+    async def render_cached_anon(self, template_name: str) -> bytes:
+        """
+        Render a template for an anonymous visitor, reusing earlier output.
+        
+        Only use this for pages whose output depends on nothing but the
+        menu. The cache is dropped whenever menu items change.
+        
+        Args:
+            template_name: Name of template file
         
-        template = self.env.get_template(template_name)
-        return await template.render_async(**context)
+        Returns:
+            Rendered HTML encoded as UTF-8
+        """
+        page = self._anon_pages.get(template_name)
+        if page is None:
+            page = (await self.render(template_name, current_user=None)).encode("utf-8")
+            self._anon_pages[template_name] = page
+        return page
     
     def render_sync(self, template_name: str, **context) -> str:
         """
@@ -217,17 +374,42 @@ class TemplateService:
         
         Args:
             template_name: Name of template file
-            **context: Template context variables
+            **context: Template context variables (current_user defaults
+                to the user bound to this request)
         
         Returns:
             Rendered HTML string
         """
-        # Add menu items to context
-        current_user = context.get('current_user')
-        context['menu_items'] = self.menu_registry.get_items(current_user)
+        return self._render(template_name, context)
+    
+    def get_current_user(self, request) -> Optional[dict]:
+        """
+        Get the logged-in user for a request.
+        
+        The session is read once per request and the result is cached
+        on ``request.state.current_user`` for later calls. It is also
+        bound to ``CURRENT_USER`` so ``render`` can pick it up without
+        being passed ``current_user``.
+        
+        Args:
+            request: Incoming HTTP request
         
-        template = self.env.get_template(template_name)
-        return template.render(**context)
+        Returns:
+            Session user dictionary, or None if not logged in
+        """
+        state = request.state
+        try:
+            return state.current_user
+        except AttributeError:
+            pass
+        
+        # Read the session straight from the ASGI scope instead of going
+        # through the Request.session property
+        session = request.scope.get("session") if self.sessions_enabled else None
+        current_user = session.get("user") if session else None
+        state.current_user = current_user
+        CURRENT_USER.set(current_user)
+        return current_user
     
     def get_static_path(self) -> Path:
         """Get path to static files directory."""
@@ -256,6 +438,7 @@ class TemplateService:
         Returns:
             Unique key for the registered item
         """
+        self._anon_pages.clear()
         return self.menu_registry.register(
             label=label,
             url=url,
@@ -273,7 +456,22 @@ class TemplateService:
             key: Specific item key to unregister
             module_name: Unregister all items from this module
         """
+        self._anon_pages.clear()
         self.menu_registry.unregister(key=key, module_name=module_name)
+    
+    def register_menu_items(self, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Register several menu items at once.
+        
+        Args:
+            items: Keyword arguments for register_menu_item, one dict per item
+        
+        Returns:
+            Unique keys of the registered items, in order
+        """
+        self._anon_pages.clear()
+        with self.menu_registry.batch():
+            return [self.menu_registry.register(**item) for item in items]
 
 
 class TemplateServiceModule(IModule):
@@ -298,14 +496,8 @@ class TemplateServiceModule(IModule):
         self.config = context.services.get("core_config")
         self.http_api = context.services.get("http_api")
         
-        # Get module directory
-        module_dir = Path(__file__).parent
-        
         # Create template service
-        templates_dir = module_dir / "templates"
-        static_dir = module_dir / "static"
-        
-        self.template_service = TemplateService(templates_dir, static_dir)
+        self.template_service = TemplateService(TEMPLATES_DIR, STATIC_DIR)
         
         # Register service
         context.services.set("template_service", self.template_service)
@@ -315,17 +507,28 @@ class TemplateServiceModule(IModule):
     
     async def start(self, context):
         """Start template service and mount static files."""
+        # Start-up messages are collected and written in one logger call
+        messages = []
+        
         # Mount static files if http_api is available
         if self.http_api and self.template_service:
             # Get the underlying FastAPI app from HTTPAPI
             app = self.http_api._app
+            
+            # Detect sessions once so handlers never probe the request
+            self.template_service.sessions_enabled = any(
+                base.__name__ == "SessionMiddleware"
+                for middleware in app.user_middleware
+                for base in middleware.cls.__mro__
+            )
+            
             static_path = self.template_service.get_static_path()
             if static_path.exists():
-                # Use StaticFiles from http_api instead of direct import
-                app.mount("/static", self.http_api.StaticFiles(directory=str(static_path)), name="static")
-                if self.logger:
-                    self.logger.log(f"Static files mounted at /static from {static_path}", tag="template")
+                # Serve assets from memory with ETag/304 support
+                app.mount("/static", self.http_api.CachedStaticFiles(directory=str(static_path)), name="static")
+                messages.append(f"Static files mounted at /static from {static_path}")
         
         if self.logger:
-            self.logger.log("TemplateService module started", tag="template")
+            messages.append("TemplateService module started")
+            self.logger.log_many(messages, tag="template")
     
\ No newline at end of file
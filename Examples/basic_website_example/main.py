@@ -17,6 +17,12 @@ sys.path.insert(0, str(MASSIR_ROOT))
 
 from massir import App
 
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 async def main():
     """
@@ -56,6 +62,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -7,10 +7,18 @@ This module provides:
 - Session-based connection storage
 - Connection service for other modules to use
 """
+import asyncio
+
 from massir.core.interfaces import IModule, ModuleContext
 from .services import ConnectionService, LogManager
 from .routes import register_routes
 
+# Menu items registered on start
+_MENUS = (
+    {"id": "db_connection", "label": "Connection", "url": "/db/connection", "icon": "🔗", "order": 10},
+)
+_MENU_IDS = tuple(menu["id"] for menu in _MENUS)
+
 
 class DbConnectionModule(IModule):
     """
@@ -24,27 +32,32 @@ class DbConnectionModule(IModule):
     provides = ["db_connection_service", "db_connection_types"]
     requires = ["database_service"]  # Requires system_database module
     
+    # Fixed per-instance state lives in slots; IModule still provides a
+    # __dict__ for the attributes the module loader sets (_context, id, ...)
+    __slots__ = (
+        "http_api", "logger", "template", "menu_manager", "path_manager",
+        "connection_service", "log_manager"
+    )
+    
     def __init__(self):
         self.http_api = None
         self.logger = None
         self.template = None
         self.menu_manager = None
+        self.path_manager = None
         self.connection_service = None
         self.log_manager = None
     
     async def load(self, context: ModuleContext):
         """Get services and initialize connection service."""
-        self.http_api = context.services.get("http_api")
-        self.logger = context.services.get("core_logger")
-        self.template = context.services.get("template_service")
-        self.menu_manager = context.services.get("menu_manager")
-        self.path_manager = context.services.get("core_path")
-        
-        # Get database_service from system_database module (provided via context)
-        database_service = context.services.get("database_service")
-        
-        # Get database_types from system_database module (provided via context)
-        database_types = context.services.get("database_types")
+        (
+            self.http_api, self.logger, self.template, self.menu_manager, self.path_manager,
+            # database_service and database_types come from the system_database module
+            database_service, database_types
+        ) = context.services.get_many(
+            "http_api", "core_logger", "template_service", "menu_manager", "core_path",
+            "database_service", "database_types"
+        )
         
         # Create a LogManager instance for the connection service
         self.log_manager = LogManager(self.logger)
@@ -78,22 +91,30 @@ class DbConnectionModule(IModule):
         
         # Register menu item
         if self.menu_manager:
-            self.menu_manager.register_menu(
-                id="db_connection",
-                label="Connection",
-                url="/db/connection",
-                icon="🔗",
-                order=10
-            )
+            self.menu_manager.register_menus(_MENUS)
     
     async def stop(self, context: ModuleContext):
         """Cleanup resources."""
         # Disconnect all connections
         if self.connection_service:
-            # Disconnect all active connections
-            for conn_name in list(self.connection_service._connection_info.keys()):
-                await self.connection_service.disconnect(conn_name)
+            # Close all active connections concurrently
+            names = list(self.connection_service._connection_info.keys())
+            results = await asyncio.gather(
+                *[self.connection_service.disconnect(name) for name in names],
+                return_exceptions=True
+            )
+            errors = [
+                f"{name}: {result}"
+                for name, result in zip(names, results)
+                if isinstance(result, Exception)
+            ]
+            if errors and self.logger:
+                self.logger.log(
+                    f"Failed to disconnect {len(errors)} connection(s): {'; '.join(errors)}",
+                    level="ERROR",
+                    tag="db_connection"
+                )
         
         # Unregister menu items
         if self.menu_manager:
-            self.menu_manager.unregister_menu("db_connection")
+            self.menu_manager.unregister_menus(_MENU_IDS)
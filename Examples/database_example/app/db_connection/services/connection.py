@@ -7,13 +7,19 @@ This module provides connection-related operations:
 - Connect/Disconnect
 - Connection info management
 """
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from .models import ConnectionInfo, LogManager
 
 
+# Seconds a table listing is reused, e.g. after a prefetch
+TABLES_CACHE_TTL = 5.0
+
+
 class ConnectionService:
     """
     Connection management service that provides database connection services.
@@ -52,6 +58,15 @@ class ConnectionService:
         # Connection state
         self._active_connection: Optional[str] = None
         self._connection_info: Dict[str, ConnectionInfo] = {}
+        # Incremented whenever connections or the active connection change
+        self._conn_version = 0
+        # (conn_version, connection dicts) from the last get_connections call
+        self._conn_list_cache: Optional[Tuple[int, list]] = None
+        
+        # connection name -> (monotonic fetch time, table names)
+        self._tables_cache: Dict[str, Tuple[float, List[str]]] = {}
+        # Running prefetch tasks, keyed by connection name
+        self._prefetch_tasks: Dict[str, asyncio.Task] = {}
     
     def _resolve_path(self, path: str) -> str:
         """Resolve path with support for placeholders."""
@@ -132,25 +147,32 @@ class ConnectionService:
         if not test_result["success"]:
             return test_result
         
+        # Read the connection fields once; both records below share them
+        get = config.get
+        host, port, database, user, password, path = (
+            get("host", "localhost"), get("port"), get("database"),
+            get("user"), get("password"), get("path")
+        )
+        
         try:
             # Build config with pool settings
             db_config_dict = {
                 "name": name,
                 "driver": driver,
-                "host": config.get("host", "localhost"),
-                "port": config.get("port"),
-                "database": config.get("database"),
-                "user": config.get("user"),
-                "password": config.get("password"),
-                "path": config.get("path"),
+                "host": host,
+                "port": port,
+                "database": database,
+                "user": user,
+                "password": password,
+                "path": path,
                 # Pool settings
-                "pool_min_size": config.get("pool_min_size", 5),
-                "pool_max_size": config.get("pool_max_size", 20),
-                "pool_timeout": config.get("pool_timeout", 30.0),
-                "connect_timeout": config.get("connect_timeout", 10.0),
+                "pool_min_size": get("pool_min_size", 5),
+                "pool_max_size": get("pool_max_size", 20),
+                "pool_timeout": get("pool_timeout", 30.0),
+                "connect_timeout": get("connect_timeout", 10.0),
                 # Cache settings
-                "cache_enabled": config.get("cache_enabled", True),
-                "cache_ttl": config.get("cache_ttl", 300)
+                "cache_enabled": get("cache_enabled", True),
+                "cache_ttl": get("cache_ttl", 300)
             }
             
             # Get DatabaseConfig type from context
@@ -170,20 +192,21 @@ class ConnectionService:
             conn_info = ConnectionInfo(
                 name=name,
                 driver=driver,
-                host=config.get("host", "localhost"),
-                port=config.get("port"),
-                database=config.get("database"),
-                user=config.get("user"),
-                password=config.get("password"),
-                path=config.get("path"),
+                host=host,
+                port=port,
+                database=database,
+                user=user,
+                password=password,
+                path=path,
                 connected=True,
-                connection_time=datetime.now()
+                connection_time=datetime.now(),
+                resolved_path=resolved_path
             )
-            if resolved_path:
-                conn_info.resolved_path = resolved_path
             
             self._connection_info[name] = conn_info
             self._active_connection = name
+            self._tables_cache.pop(name, None)
+            self._conn_version += 1
             
             self._log(f"Connected to {driver} database: {name}", "INFO")
             
@@ -220,9 +243,11 @@ class ConnectionService:
         
         if conn_name in self._connection_info:
             del self._connection_info[conn_name]
+        self._tables_cache.pop(conn_name, None)
         
         if self._active_connection == conn_name:
             self._active_connection = next(iter(self._connection_info), None)
+        self._conn_version += 1
         
         self._log(f"Disconnected from database: {conn_name}", "INFO")
         
@@ -242,8 +267,26 @@ class ConnectionService:
         return self._connection_info.get(conn_name) if conn_name else None
     
     def get_connections(self) -> list:
-        """Get all connections info."""
-        return [conn.to_dict() for conn in self._connection_info.values()]
+        """Get all connections info.
+        
+        The list is cached until connections change and is shared between
+        callers, so it must not be modified.
+        """
+        cached = self._conn_list_cache
+        if cached is None or cached[0] != self._conn_version:
+            cached = (self._conn_version, [conn.to_dict() for conn in self._connection_info.values()])
+            self._conn_list_cache = cached
+        return cached[1]
+    
+    @property
+    def conn_version(self) -> int:
+        """Counter that changes whenever connections or the active connection change."""
+        return self._conn_version
+    
+    @property
+    def log_version(self) -> int:
+        """Counter that changes whenever the connection log changes."""
+        return self._log_manager.version
     
     def get_active_connection_name(self) -> Optional[str]:
         """Get active connection name."""
@@ -253,6 +296,8 @@ class ConnectionService:
         """Set a connection as active."""
         if name in self._connection_info:
             self._active_connection = name
+            self._tables_cache.pop(name, None)
+            self._conn_version += 1
             return True
         return False
     
@@ -264,12 +309,65 @@ class ConnectionService:
         """Get database types from context."""
         return self._db_types
     
+    # ==================== Tables ====================
+    
+    async def list_tables(self, name: str = None) -> List[str]:
+        """List the tables of a connection, reusing a listing up to TABLES_CACHE_TTL old.
+        
+        Raises whatever the database connection raises.
+        """
+        conn_name = name or self._active_connection
+        if not conn_name or not self._db_service.has_connection(conn_name):
+            return []
+        
+        now = time.monotonic()
+        cached = self._tables_cache.get(conn_name)
+        if cached is None or now - cached[0] > TABLES_CACHE_TTL:
+            tables = await self._db_service.get_connection(conn_name).list_tables()
+            cached = (now, tables)
+            self._tables_cache[conn_name] = cached
+        return list(cached[1])
+    
+    def prefetch_tables(self, name: str = None):
+        """Load a connection's table listing in the background.
+        
+        Pages call this so the next Tables or Dashboard page is served
+        from a warm listing; the caller does not wait for it.
+        """
+        conn_name = name or self._active_connection
+        if not conn_name or conn_name in self._prefetch_tasks:
+            return
+        cached = self._tables_cache.get(conn_name)
+        if cached is not None and time.monotonic() - cached[0] <= TABLES_CACHE_TTL:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._prefetch_tables(conn_name))
+        self._prefetch_tasks[conn_name] = task
+        task.add_done_callback(lambda _: self._prefetch_tasks.pop(conn_name, None))
+    
+    async def _prefetch_tables(self, name: str):
+        try:
+            await self.list_tables(name)
+        except Exception:
+            # A failed prefetch only means the next page queries itself
+            pass
+    
+    def invalidate_tables(self, name: str = None):
+        """Forget the cached table listing after statements that may change the tables."""
+        conn_name = name or self._active_connection
+        if conn_name:
+            self._tables_cache.pop(conn_name, None)
+    
     # ==================== Logging ====================
     
     def get_logs(self, count: int = 50) -> list:
         """Get recent logs."""
         return self._log_manager.get_logs(count) if hasattr(self, '_log_manager') else []
     
+    def get_rendered_logs(self, count: int = 50) -> list:
+        """Get the pre-rendered HTML of recent logs."""
+        return self._log_manager.get_rendered(count) if hasattr(self, '_log_manager') else []
+    
     def clear_logs(self):
         """Clear all logs."""
         if hasattr(self, '_log_manager'):
@@ -278,9 +376,11 @@ class ConnectionService:
     # ==================== Cache & Pool ====================
     
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics from database service."""
+        """Get the active connection's cache statistics from database service."""
+        if not self._active_connection:
+            return {}
         try:
-            return self._db_service.cache_stats
+            return self._db_service.get_cache_stats(self._active_connection)
         except Exception:
             return {}
     
@@ -6,9 +6,23 @@ This module provides:
 - LogEntry: Data class for log entries
 - LogManager: Manages log entries
 """
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from html import escape
+from itertools import islice
+from typing import Deque, Optional, List
+
+
+# HTML for one log entry, rendered once when the entry is added
+LOG_HTML_TMPL = """
+            <div class="log-entry log-{level_lower}">
+                <span class="log-time">{timestamp}</span>
+                <span class="log-level">[{level}]</span>
+                <span class="log-message">{message}</span>
+            </div>
+            """
+_format_log_html = LOG_HTML_TMPL.format
 
 
 @dataclass
@@ -40,8 +54,19 @@ class ConnectionInfo:
             "resolved_path": self.resolved_path,
             "connected": self.connected,
             "connection_time": str(self.connection_time) if self.connection_time else None,
-            "error_message": self.error_message
+            "error_message": self.error_message,
+            # Display values, so pages only substitute them
+            "driver_upper": self.driver.upper(),
+            "display_path": self.display_path
         }
+    
+    @property
+    def display_path(self) -> str:
+        """Path for SQLite, host[:port] for PostgreSQL/MySQL."""
+        if self.driver == "sqlite":
+            return self.resolved_path or self.path or "-"
+        host = self.host or "localhost"
+        return f"{host}:{self.port}" if self.port else host
 
 
 @dataclass
@@ -59,15 +84,29 @@ class LogEntry:
             "message": self.message,
             "details": self.details
         }
+    
+    def to_html(self) -> str:
+        """Render the entry for the connection page, escaping the message."""
+        return _format_log_html(
+            level_lower=self.level.lower(),
+            timestamp=self.timestamp.strftime("%H:%M:%S"),
+            level=self.level,
+            message=escape(self.message)
+        )
 
 
 class LogManager:
     """Manages log entries for database operations."""
     
     def __init__(self, logger=None, max_logs: int = 100):
-        self._logs: List[LogEntry] = []
+        # Bounded queues drop the oldest entry once max_logs is reached
+        self._logs: Deque[LogEntry] = deque(maxlen=max_logs)
+        # Pre-rendered HTML of each entry, kept parallel to _logs
+        self._rendered: Deque[str] = deque(maxlen=max_logs)
         self._max_logs = max_logs
         self._logger = logger
+        # Incremented on every change so cached views know when to rebuild
+        self.version = 0
     
     def log(self, message: str, level: str = "INFO", details: str = ""):
         """Add a log entry."""
@@ -78,19 +117,28 @@ class LogManager:
             details=details
         )
         self._logs.append(entry)
-        
-        # Keep only last N logs
-        if len(self._logs) > self._max_logs:
-            self._logs = self._logs[-self._max_logs:]
+        self._rendered.append(entry.to_html())
+        self.version += 1
         
         if self._logger:
             self._logger.log(message, tag="db_connection", level=level)
     
     def get_logs(self, limit: int = 50) -> List[dict]:
         """Get recent log entries."""
-        return [log.to_dict() for log in self._logs[-limit:]]
+        return [log.to_dict() for log in self._tail(self._logs, limit)]
+    
+    def get_rendered(self, limit: int = 50) -> List[str]:
+        """Get the pre-rendered HTML of recent log entries."""
+        return list(self._tail(self._rendered, limit))
+    
+    @staticmethod
+    def _tail(entries: deque, limit: int):
+        """Iterate over the last ``limit`` items of a deque."""
+        return islice(entries, max(0, len(entries) - limit), None)
     
     def clear(self):
         """Clear all logs."""
-        self._logs = []
+        self._logs.clear()
+        self._rendered.clear()
+        self.version += 1
         self.log("Logs cleared", "INFO")
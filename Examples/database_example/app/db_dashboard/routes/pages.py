@@ -6,142 +6,106 @@ This module provides routes for:
 - Connection information
 - Cache and pool statistics
 """
+import asyncio
+import hashlib
+import json
+import time
+from html import escape
 
 
-def register_routes(http_api, template, dashboard_service, connection_service, logger):
-    """Register dashboard routes."""
-    
-    @http_api.get("/db/dashboard")
-    async def dashboard_page(request: http_api.Request):
-        """Dashboard page."""
-        if not connection_service.is_connected():
-            content = """
+# Seconds a table summary is reused before it is queried again
+TABLES_CACHE_TTL = 2.0
+_TABLES_CACHE_CONTROL = f"private, max-age={int(TABLES_CACHE_TTL)}"
+# Tables listed (and counted) on the dashboard
+TABLES_SHOWN = 10
+
+
+# Static parts of the page
+_DISCONNECTED_HTML = """
             <div class="card">
                 <h1>📊 Dashboard</h1>
                 <p class="text-muted">No database connection. Please <a href="/db/connection">connect to a database</a> first.</p>
             </div>
             """
-            html = template.render(content, title="Dashboard", active_menu="db_dashboard")
-            return http_api.HTMLResponse(content=html)
-        
-        data = await dashboard_service.get_dashboard_data()
-        
-        # Build database info HTML
-        db_info = data.get("database", {})
-        if db_info.get("connected"):
-            db_html = f"""
-            <div class="stats-grid">
+_DASHBOARD_STYLE = """
+        <style>
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 1rem;
+        }
+        .stat-card {
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: 8px;
+            padding: 1.5rem;
+            text-align: center;
+        }
+        .stat-value {
+            font-size: 2rem;
+            font-weight: bold;
+            color: var(--primary-color);
+        }
+        .stat-label {
+            color: var(--text-muted);
+            margin-top: 0.5rem;
+        }
+        </style>
+        """
+
+# Page templates, parsed once here and filled in per request
+_STAT_CARD_TMPL = """
                 <div class="stat-card">
-                    <div class="stat-value">{db_info.get('tables_count', 0)}</div>
-                    <div class="stat-label">Tables</div>
-                </div>
+                    <div class="stat-value">{value}</div>
+                    <div class="stat-label">{label}</div>
+                </div>"""
+_STATS_GRID_TMPL = """
+            <div class="stats-grid">{cards}
             </div>
             """
-        else:
-            db_html = '<p class="text-muted">Database information unavailable.</p>'
-        
-        # Build table stats HTML
-        table_stats = data.get("tables", [])
-        if table_stats:
-            table_rows = ""
-            for stat in table_stats[:10]:  # Show first 10 tables
-                table_rows += f"""
+_TABLE_ROW_TMPL = """
                 <tr>
-                    <td>{stat.get('name', '-')}</td>
-                    <td>{stat.get('rows', 0)}</td>
+                    <td>{name}</td>
+                    <td>{rows}</td>
                 </tr>
                 """
-            tables_html = f"""
+_TABLES_TMPL = """
             <div class="table-wrapper">
                 <table>
                     <thead><tr><th>Table</th><th>Rows</th></tr></thead>
-                    <tbody>{table_rows}</tbody>
+                    <tbody>{rows}</tbody>
                 </table>
             </div>
             """
-        else:
-            tables_html = '<p class="text-muted">No tables found.</p>'
-        
-        # Build connections HTML
-        conn_info = data.get("connections", {})
-        connections = conn_info.get("connections", [])
-        if connections:
-            conn_rows = ""
-            for conn in connections:
-                status = "✅ Connected" if conn.get("connected") else "❌ Disconnected"
-                active_badge = ' <span class="badge badge-primary">Active</span>' if conn.get("name") == conn_info.get("active") else ""
-                conn_rows += f"""
+_CONN_ROW_TMPL = """
                 <tr>
-                    <td>{conn.get('name')}{active_badge}</td>
-                    <td>{conn.get('driver', '-').upper()}</td>
+                    <td>{name}{active_badge}</td>
+                    <td>{driver}</td>
                     <td>{status}</td>
                 </tr>
                 """
-            conn_html = f"""
+_CONNECTIONS_TMPL = """
             <div class="table-wrapper">
                 <table>
                     <thead><tr><th>Name</th><th>Driver</th><th>Status</th></tr></thead>
-                    <tbody>{conn_rows}</tbody>
+                    <tbody>{rows}</tbody>
                 </table>
             </div>
             """
-        else:
-            conn_html = '<p class="text-muted">No connections.</p>'
-        
-        # Build cache stats HTML
-        cache_stats = data.get("cache", {})
-        if cache_stats:
-            cache_html = f"""
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value">{cache_stats.get('size', 0)}</div>
-                    <div class="stat-label">Cache Size</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value">{cache_stats.get('hits', 0)}</div>
-                    <div class="stat-label">Cache Hits</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value">{cache_stats.get('misses', 0)}</div>
-                    <div class="stat-label">Cache Misses</div>
-                </div>
-            </div>
-            """
-        else:
-            cache_html = '<p class="text-muted">Cache statistics unavailable.</p>'
-        
-        # Build pool info HTML
-        pool_info = data.get("pool", {})
-        if pool_info:
-            pool_html = f"""
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value">{pool_info.get('size', '-')}</div>
-                    <div class="stat-label">Pool Size</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value">{pool_info.get('idle', '-')}</div>
-                    <div class="stat-label">Idle Connections</div>
-                </div>
-            </div>
-            """
-        else:
-            pool_html = '<p class="text-muted">Pool information unavailable.</p>'
-        
-        content = f"""
+_DASHBOARD_TMPL = """
         <div class="card">
             <h1>📊 Dashboard</h1>
-            <p class="text-muted">Database overview and statistics. Active: <strong>{connection_service.get_active_connection_name()}</strong></p>
+            <p class="text-muted">Database overview and statistics. Active: <strong>{active_name}</strong></p>
         </div>
         
         <div class="card">
             <h2 class="card-title">Database Overview</h2>
-            {db_html}
+            <div id="dashboard-database"><p class="text-muted">Loading…</p></div>
         </div>
         
         <div class="card">
             <h2 class="card-title">Tables</h2>
-            {tables_html}
+            <div id="dashboard-tables"><p class="text-muted">Loading…</p></div>
         </div>
         
         <div class="card">
@@ -158,31 +122,161 @@ def register_routes(http_api, template, dashboard_service, connection_service, l
             <h2 class="card-title">Connection Pool</h2>
             {pool_html}
         </div>
-        
-        <style>
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 1rem;
-        }}
-        .stat-card {{
-            background: var(--card-bg);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            padding: 1.5rem;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 2rem;
-            font-weight: bold;
-            color: var(--primary-color);
-        }}
-        .stat-label {{
-            color: var(--text-muted);
-            margin-top: 0.5rem;
-        }}
-        </style>
         """
+
+# Fills the query-backed cards once the page is shown
+_DASHBOARD_SCRIPT = """
+        <script>
+        fetch('/db/api/dashboard/tables')
+            .then(response => response.json())
+            .then(data => {
+                document.getElementById('dashboard-database').innerHTML = data.database_html;
+                document.getElementById('dashboard-tables').innerHTML = data.tables_html;
+            })
+            .catch(() => {
+                const unavailable = '<p class="text-muted">Information unavailable.</p>';
+                document.getElementById('dashboard-database').innerHTML = unavailable;
+                document.getElementById('dashboard-tables').innerHTML = unavailable;
+            });
+        </script>
+        """
+# Script and style follow the per-request markup, encoded once
+_DASHBOARD_ASSETS = (_DASHBOARD_SCRIPT + _DASHBOARD_STYLE).encode("utf-8")
+
+_format_stat_card = _STAT_CARD_TMPL.format
+_format_stats_grid = _STATS_GRID_TMPL.format
+_format_table_row = _TABLE_ROW_TMPL.format
+_format_tables = _TABLES_TMPL.format
+_format_conn_row = _CONN_ROW_TMPL.format
+_format_connections = _CONNECTIONS_TMPL.format
+_format_dashboard = _DASHBOARD_TMPL.format
+
+_ACTIVE_BADGE = ' <span class="badge badge-primary">Active</span>'
+
+
+def _stats_grid(*cards) -> str:
+    """Build a grid of (value, label) stat cards."""
+    return _format_stats_grid(cards="".join(
+        _format_stat_card(value=escape(str(value)), label=label) for value, label in cards
+    ))
+
+
+def _build_table_sections(data: dict) -> dict:
+    """Build the database overview and tables cards from the table data."""
+    # Build database info HTML
+    db_info = data.get("database", {})
+    if db_info.get("connected"):
+        db_html = _stats_grid((db_info.get('tables_count', 0), "Tables"))
+    else:
+        db_html = '<p class="text-muted">Database information unavailable.</p>'
+    
+    # Build table stats HTML
+    table_stats = data.get("tables", [])
+    if table_stats:
+        tables_html = _format_tables(rows="".join(
+            _format_table_row(name=escape(str(stat.get('name', '-'))), rows=stat.get('rows', 0))
+            for stat in table_stats[:TABLES_SHOWN]
+        ))
+    else:
+        tables_html = '<p class="text-muted">No tables found.</p>'
+    
+    return {"database_html": db_html, "tables_html": tables_html}
+
+
+def _build_status_sections(data: dict) -> dict:
+    """Build the connections, cache and pool cards from the status data."""
+    # Build connections HTML
+    conn_info = data.get("connections", {})
+    connections = conn_info.get("connections", [])
+    if connections:
+        active_name = conn_info.get("active")
+        conn_html = _format_connections(rows="".join(
+            _format_conn_row(
+                name=escape(str(conn.get('name'))),
+                active_badge=_ACTIVE_BADGE if conn.get("name") == active_name else "",
+                driver=escape(conn.get('driver', '-').upper()),
+                status="✅ Connected" if conn.get("connected") else "❌ Disconnected",
+            )
+            for conn in connections
+        ))
+    else:
+        conn_html = '<p class="text-muted">No connections.</p>'
+    
+    # Build cache stats HTML
+    cache_stats = data.get("cache", {})
+    if cache_stats:
+        cache_html = _stats_grid(
+            (cache_stats.get('size', 0), "Cache Size"),
+            (cache_stats.get('hits', 0), "Cache Hits"),
+            (cache_stats.get('misses', 0), "Cache Misses"),
+            (f"{cache_stats.get('hit_rate', 0)}%", "Hit Rate"),
+        )
+    else:
+        cache_html = '<p class="text-muted">Cache statistics unavailable.</p>'
+    
+    # Build pool info HTML
+    pool_info = data.get("pool", {})
+    if pool_info:
+        pool_html = _stats_grid(
+            (pool_info.get('size', '-'), "Pool Size"),
+            (pool_info.get('idle', '-'), "Idle Connections"),
+        )
+    else:
+        pool_html = '<p class="text-muted">Pool information unavailable.</p>'
+    
+    return {"conn_html": conn_html, "cache_html": cache_html, "pool_html": pool_html}
+
+
+def register_routes(http_api, template, dashboard_service, connection_service, logger):
+    """Register dashboard routes."""
+    
+    @http_api.get("/db/dashboard")
+    async def dashboard_page(request: http_api.Request):
+        """Dashboard page."""
+        if not connection_service.is_connected():
+            # Fully static: rendered once per menu version and shared
+            return template.cached_response(_DISCONNECTED_HTML, title="Dashboard", active_menu="db_dashboard")
+        
+        # Only in-memory data here; the cards that need queries load afterwards.
+        # Only this part is encoded per request; the rest is cached as bytes
+        head, tail = template.render_shell_encoded(title="Dashboard", active_menu="db_dashboard")
+        body = b"".join((
+            head,
+            _format_dashboard(
+                active_name=escape(str(connection_service.get_active_connection_name())),
+                **_build_status_sections(dashboard_service.get_status_data())
+            ).encode("utf-8"),
+            _DASHBOARD_ASSETS,
+            tail,
+        ))
+        return http_api.HTMLResponse(content=body)
+    
+    # Connection name -> (expires at, JSON body, etag)
+    tables_cache = {}
+    # Connection name -> lock, so concurrent misses run the queries once
+    tables_locks = {}
+    
+    async def table_summary(conn_name):
+        cached = tables_cache.get(conn_name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached
+        async with tables_locks.setdefault(conn_name, asyncio.Lock()):
+            cached = tables_cache.get(conn_name)
+            if cached is None or cached[0] <= time.monotonic():
+                data = await dashboard_service.get_table_data(tables_limit=TABLES_SHOWN)
+                body = json.dumps(_build_table_sections(data)).encode("utf-8")
+                etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+                cached = (time.monotonic() + TABLES_CACHE_TTL, body, etag)
+                tables_cache[conn_name] = cached
+        return cached
+    
+    @http_api.get("/db/api/dashboard/tables")
+    async def api_dashboard_tables(request: http_api.Request):
+        """Database overview and table cards, as HTML fragments."""
+        _, body, etag = await table_summary(connection_service.get_active_connection_name())
+        headers = {"etag": etag, "cache-control": _TABLES_CACHE_CONTROL}
         
-        html = template.render(content, title="Dashboard", active_menu="db_dashboard")
-        return http_api.HTMLResponse(content=html)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return http_api.PlainTextResponse(content=b"", status_code=304, headers=headers)
+        return http_api.PlainTextResponse(content=body, media_type="application/json", headers=headers)
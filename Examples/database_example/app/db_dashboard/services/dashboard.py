@@ -6,7 +6,8 @@ This module provides dashboard-related operations:
 - Get connection info
 - Get cache statistics
 """
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 
 
 class DashboardService:
@@ -18,6 +19,7 @@ class DashboardService:
     - get_active_connection_name(): Returns the active connection name
     - is_connected(): Checks if there's an active connection
     - get_connections(): Returns all connections info
+    - list_tables(): Returns the (cached) table listing
     - get_cache_stats(): Returns cache statistics
     - get_pool_info(): Returns pool information
     """
@@ -43,8 +45,7 @@ class DashboardService:
             return {"connected": False}
         
         try:
-            conn = self._db_service.get_connection(self._active_connection)
-            tables = await conn.list_tables()
+            tables = await self._connection.list_tables(self._active_connection)
             
             return {
                 "connected": True,
@@ -55,30 +56,35 @@ class DashboardService:
         except Exception as e:
             return {"connected": False, "error": str(e)}
     
-    async def get_table_stats(self) -> List[Dict[str, Any]]:
-        """Get statistics for all tables."""
+    async def get_table_stats(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get statistics for all tables, or for the first ``limit`` of them."""
         if not self._active_connection:
             return []
         
         try:
             conn = self._db_service.get_connection(self._active_connection)
-            tables = await conn.list_tables()
-            stats = []
-            
-            for table in tables:
-                try:
-                    count = await conn.count(table)
-                    stats.append({
-                        "name": table,
-                        "rows": count or 0
-                    })
-                except Exception:
-                    stats.append({
-                        "name": table,
-                        "rows": 0
-                    })
+            tables = await self._connection.list_tables(self._active_connection)
+            if limit is not None:
+                tables = tables[:limit]
             
-            return stats
+            try:
+                # One UNION ALL query instead of a COUNT(*) round-trip per table
+                counts = await conn.count_tables(tables)
+            except Exception:
+                # A table the batch cannot read fails the whole query; count
+                # them one by one so only that table shows as 0 rows
+                results = await asyncio.gather(
+                    *(conn.count(table) for table in tables),
+                    return_exceptions=True
+                )
+                counts = {
+                    table: 0 if isinstance(count, BaseException) else count
+                    for table, count in zip(tables, results)
+                }
+            return [
+                {"name": table, "rows": counts.get(table) or 0}
+                for table in tables
+            ]
         except Exception as e:
             return []
     
@@ -101,18 +107,31 @@ class DashboardService:
         """Get pool information."""
         return self._connection.get_pool_info() or {}
     
-    async def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get all dashboard data."""
+    async def get_table_data(self, tables_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the dashboard data that needs database queries.
+        
+        Args:
+            tables_limit: Only count the rows of this many tables; the
+                tables count in the database info still covers all of them
+        """
+        # Runs first so the table counts below reuse its (cached) table listing
         db_info = await self.get_database_info()
-        table_stats = await self.get_table_stats()
-        conn_info = self.get_connection_info()
-        cache_stats = self.get_cache_stats()
-        pool_info = self.get_pool_info()
+        table_stats = await self.get_table_stats(tables_limit)
         
         return {
             "database": db_info,
-            "tables": table_stats,
-            "connections": conn_info,
-            "cache": cache_stats,
-            "pool": pool_info
+            "tables": table_stats
+        }
+    
+    def get_status_data(self) -> Dict[str, Any]:
+        """Get the dashboard data kept in memory: connections, cache and pool."""
+        return {
+            "connections": self.get_connection_info(),
+            "cache": self.get_cache_stats(),
+            "pool": self.get_pool_info()
         }
+    
+    async def get_dashboard_data(self) -> Dict[str, Any]:
+        """Get all dashboard data."""
+        return {**await self.get_table_data(), **self.get_status_data()}
@@ -7,11 +7,65 @@ This module provides routes for:
 - Updating existing records
 - Deleting records
 """
+import base64
+import json
+from html import escape
+from urllib.parse import quote
+
+
+# Rows per data editor page
+PAGE_SIZE = 50
+
+# <option> element for the table selector, formatted once per table
+_OPTION_TMPL = '<option value="{value}"{selected}>{label}</option>'
+_format_option = _OPTION_TMPL.format
+
+
+def _encode_cursor(value) -> str:
+    """Serialize a row key into an opaque, URL-safe page cursor."""
+    raw = json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor):
+    """Read a page cursor back into the row key; None if missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        return None
 
 
 def register_routes(http_api, template, data_service, connection_service, logger):
     """Register data editor routes."""
     
+    async def record_key(table_name: str, record_id: str):
+        """
+        Load a table's schema and the (column, typed value) addressing a record.
+        
+        Returns (schema, pk_column, key); key is None if record_id does not
+        fit the key column's type.
+        """
+        schema = await data_service.get_table_schema(table_name)
+        try:
+            pk_column, key = data_service.record_key(schema, record_id)
+        except ValueError:
+            return schema, None, None
+        return schema, pk_column, key
+    
+    def failure_page(title: str, table_name: str, error: str):
+        """Page reporting a failed change, linking back to the table's data."""
+        content = f"""
+        <div class="card">
+            <h1>{title}</h1>
+            <p class="text-danger">{escape(str(error or "Unknown error"))}</p>
+            <a href="/db/data?table={quote(table_name, safe='')}" class="btn">Back to Data</a>
+        </div>
+        """
+        html = template.render(content, title=title, active_menu="db_data")
+        return http_api.HTMLResponse(content=html)
+    
     @http_api.get("/db/data")
     async def data_editor_page(request: http_api.Request):
         """Data editor page."""
@@ -29,69 +83,80 @@ def register_routes(http_api, template, data_service, connection_service, logger
         selected_table = request.query_params.get("table", "")
         
         # Build table selection dropdown
-        table_options = '<option value="">-- Select Table --</option>'
+        table_options = ['<option value="">-- Select Table --</option>']
         for table in tables:
-            selected = "selected" if table == selected_table else ""
-            table_options += f'<option value="{table}" {selected}>{table}</option>'
+            label = escape(table)
+            selected = " selected" if table == selected_table else ""
+            table_options.append(_format_option(value=label, selected=selected, label=label))
+        table_options = "".join(table_options)
         
         # Get data if table is selected
         data_html = ""
         pagination_html = ""
         if selected_table:
-            page = int(request.query_params.get("page", 1))
-            limit = 50
-            offset = (page - 1) * limit
+            params = request.query_params
+            try:
+                page = max(1, int(params.get("page", 1)))
+            except ValueError:
+                page = 1
             
-            data = await data_service.get_table_data(selected_table, limit=limit, offset=offset)
+            # Keyset paging: the cursors carry the keys bounding this page
+            data = await data_service.get_table_page(
+                selected_table, limit=PAGE_SIZE, page=page,
+                after=_decode_cursor(params.get("after")),
+                before=_decode_cursor(params.get("before"))
+            )
+            rows = data["rows"]
+            key = data["key"]
             
-            if data.get("rows"):
-                headers = list(data["rows"][0].keys())
-                rows = []
-                for row in data["rows"]:
-                    row_data = {}
-                    for h in headers:
-                        val = str(row.get(h, ""))[:100]
-                        row_data[h] = val
-                    rows.append(row_data)
+            if rows:
+                headers = list(rows[0].keys())
                 
                 # Build data table with edit/delete buttons
-                data_html = '<div class="table-wrapper"><table><thead><tr>'
-                for h in headers:
-                    data_html += f'<th>{h}</th>'
-                data_html += '<th>Actions</th></tr></thead><tbody>'
+                data_parts = ['<div class="table-wrapper"><table><thead><tr>']
+                data_parts.extend(f'<th>{escape(h)}</th>' for h in headers)
+                data_parts.append('<th>Actions</th></tr></thead><tbody>')
                 
-                for row in data["rows"]:
-                    pk_value = row.get("id", row.get(list(headers)[0], ""))
-                    data_html += '<tr>'
-                    for h in headers:
-                        val = str(row.get(h, ""))[:100]
-                        data_html += f'<td>{val}</td>'
-                    data_html += f'''
+                # Quote every path segment; a key's "/" survives because the
+                # record routes match the key with {record_id:path}
+                table_path = quote(selected_table, safe="")
+                for row in rows:
+                    pk_value = quote(str(row.get(key) if key else row.get("id", row.get(headers[0], ""))), safe="")
+                    data_parts.append('<tr>')
+                    data_parts.extend(f'<td>{escape(str(row.get(h, ""))[:100])}</td>' for h in headers)
+                    data_parts.append(f'''
                         <td class="actions">
-                            <a href="/db/data/{selected_table}/edit/{pk_value}" class="btn btn-sm">Edit</a>
-                            <a href="/db/data/{selected_table}/delete/{pk_value}" class="btn btn-sm btn-danger">Delete</a>
+                            <a href="/db/data/{table_path}/edit/{pk_value}" class="btn btn-sm">Edit</a>
+                            <a href="/db/data/{table_path}/delete/{pk_value}" class="btn btn-sm btn-danger">Delete</a>
                         </td>
-                    </tr>'''
-                data_html += '</tbody></table></div>'
+                    </tr>''')
+                data_parts.append('</tbody></table></div>')
+                data_html = "".join(data_parts)
                 
-                # Pagination
-                total = data.get("total", 0)
-                total_pages = (total + limit - 1) // limit
-                if total_pages > 1:
-                    pagination_html = '<div class="pagination">'
-                    if page > 1:
-                        pagination_html += f'<a href="/db/data?table={selected_table}&page={page-1}" class="btn btn-sm">Previous</a>'
-                    pagination_html += f'<span> Page {page} of {total_pages} </span>'
-                    if page < total_pages:
-                        pagination_html += f'<a href="/db/data?table={selected_table}&page={page+1}" class="btn btn-sm">Next</a>'
-                    pagination_html += '</div>'
+                # Pagination: only Previous/Next, so the table is never counted
+                if data["has_prev"] or data["has_next"]:
+                    if key:
+                        prev_query = f"before={_encode_cursor(rows[0][key])}"
+                        next_query = f"after={_encode_cursor(rows[-1][key])}"
+                    else:
+                        prev_query = f"page={page - 1}"
+                        next_query = f"page={page + 1}"
+                    base_url = f"/db/data?table={quote(selected_table, safe='')}"
+                    pagination = ['<div class="pagination">']
+                    if data["has_prev"]:
+                        pagination.append(f'<a href="{base_url}&{prev_query}" class="btn btn-sm">Previous</a>')
+                    if data["has_next"]:
+                        pagination.append(f'<a href="{base_url}&{next_query}" class="btn btn-sm">Next</a>')
+                    pagination.append('</div>')
+                    pagination_html = "".join(pagination)
             else:
                 data_html = '<p class="text-muted">No data in this table.</p>'
         
+        table_label = escape(selected_table)
         content = f"""
         <div class="card">
             <h1>✏️ Data Editor</h1>
-            <p class="text-muted">View and edit table data. Active: <strong>{connection_service.get_active_connection_name()}</strong></p>
+            <p class="text-muted">View and edit table data. Active: <strong>{escape(str(connection_service.get_active_connection_name()))}</strong></p>
         </div>
         
         <div class="card">
@@ -102,10 +167,10 @@ def register_routes(http_api, template, data_service, connection_service, logger
             </form>
         </div>
         
-        {f'<div class="card"><div class="card-actions"><a href="/db/data/{selected_table}/add" class="btn btn-primary">Add Record</a></div></div>' if selected_table else ''}
+        {f'<div class="card"><div class="card-actions"><a href="/db/data/{quote(selected_table, safe="")}/add" class="btn btn-primary">Add Record</a></div></div>' if selected_table else ''}
         
         <div class="card">
-            <h2 class="card-title">{f'Data: {selected_table}' if selected_table else 'Select a Table'}</h2>
+            <h2 class="card-title">{f'Data: {table_label}' if selected_table else 'Select a Table'}</h2>
             {data_html}
             {pagination_html}
         </div>
@@ -125,9 +190,9 @@ def register_routes(http_api, template, data_service, connection_service, logger
         schema = await data_service.get_table_schema(table_name)
         
         # Build form fields
-        form_fields = ""
+        form_fields = []
         for col in schema:
-            col_name = col["name"]
+            col_name = escape(col["name"])
             col_type = col.get("type", "TEXT")
             nullable = col.get("nullable", True)
             pk = col.get("primary_key", False)
@@ -150,24 +215,25 @@ def register_routes(http_api, template, data_service, connection_service, logger
             
             required = "" if nullable or pk else "required"
             
-            form_fields += f"""
+            form_fields.append(f"""
             <div class="form-group">
-                <label for="{col_name}">{col_name} <small>({col_type})</small></label>
+                <label for="{col_name}">{col_name} <small>({escape(col_type)})</small></label>
                 <input type="{input_type}" id="{col_name}" name="{col_name}" {required}>
             </div>
-            """
+            """)
         
+        table_path = quote(table_name, safe="")
         content = f"""
         <div class="card">
-            <h1>Add Record to {table_name}</h1>
+            <h1>Add Record to {escape(table_name)}</h1>
         </div>
         
         <div class="card">
-            <form action="/db/data/{table_name}/add" method="POST" class="form">
-                {form_fields}
+            <form action="/db/data/{table_path}/add" method="POST" class="form">
+                {"".join(form_fields)}
                 <div class="form-actions">
                     <button type="submit" class="btn btn-primary">Add Record</button>
-                    <a href="/db/data?table={table_name}" class="btn">Cancel</a>
+                    <a href="/db/data?table={table_path}" class="btn">Cancel</a>
                 </div>
             </form>
         </div>
@@ -189,9 +255,9 @@ def register_routes(http_api, template, data_service, connection_service, logger
         
         result = await data_service.insert_record(table_name, data)
         
-        return http_api.RedirectResponse(url=f"/db/data?table={table_name}", status_code=303)
+        return http_api.RedirectResponse(url=f"/db/data?table={quote(table_name)}", status_code=303)
     
-    @http_api.get("/db/data/{table_name}/edit/{record_id}")
+    @http_api.get("/db/data/{table_name}/edit/{record_id:path}")
     async def edit_record_form(request: http_api.Request):
         """Edit record form page."""
         table_name = request.path_params["table_name"]
@@ -200,29 +266,31 @@ def register_routes(http_api, template, data_service, connection_service, logger
         if not connection_service.is_connected():
             return http_api.RedirectResponse(url="/db/data", status_code=303)
         
-        schema = await data_service.get_table_schema(table_name)
-        record = await data_service.get_record(table_name, record_id)
+        # One indexed lookup by the table's real key, the column the list links use
+        schema, pk_column, key = await record_key(table_name, record_id)
+        record = None if key is None else await data_service.get_record(table_name, key, pk_column)
         
+        back_url = f"/db/data?table={quote(table_name, safe='')}"
         if not record:
             content = f"""
             <div class="card">
                 <h1>Record Not Found</h1>
                 <p class="text-muted">The requested record could not be found.</p>
-                <a href="/db/data?table={table_name}" class="btn">Back to Data</a>
+                <a href="{back_url}" class="btn">Back to Data</a>
             </div>
             """
             html = template.render(content, title="Record Not Found", active_menu="db_data")
             return http_api.HTMLResponse(content=html)
         
         # Build form fields with current values
-        form_fields = ""
+        form_fields = []
         for col in schema:
-            col_name = col["name"]
+            col_name = escape(col["name"])
             col_type = col.get("type", "TEXT")
             nullable = col.get("nullable", True)
             pk = col.get("primary_key", False)
             auto_inc = col.get("auto_increment", False)
-            current_value = record.get(col_name, "")
+            current_value = record.get(col["name"], "")
             
             # Make primary keys readonly
             readonly = "readonly" if pk and auto_inc else ""
@@ -238,27 +306,28 @@ def register_routes(http_api, template, data_service, connection_service, logger
                 input_type = "datetime-local"
             
             required = "" if nullable or pk else "required"
-            value_attr = f'value="{current_value}"' if current_value is not None else ""
+            value_attr = f'value="{escape(str(current_value))}"' if current_value is not None else ""
             
-            form_fields += f"""
+            form_fields.append(f"""
             <div class="form-group">
-                <label for="{col_name}">{col_name} <small>({col_type})</small></label>
+                <label for="{col_name}">{col_name} <small>({escape(col_type)})</small></label>
                 <input type="{input_type}" id="{col_name}" name="{col_name}" {value_attr} {required} {readonly}>
             </div>
-            """
+            """)
         
+        action_url = f"/db/data/{quote(table_name, safe='')}/edit/{quote(record_id, safe='')}"
         content = f"""
         <div class="card">
-            <h1>Edit Record in {table_name}</h1>
-            <p class="text-muted">Record ID: {record_id}</p>
+            <h1>Edit Record in {escape(table_name)}</h1>
+            <p class="text-muted">Record ID: {escape(record_id)}</p>
         </div>
         
         <div class="card">
-            <form action="/db/data/{table_name}/edit/{record_id}" method="POST" class="form">
-                {form_fields}
+            <form action="{action_url}" method="POST" class="form">
+                {"".join(form_fields)}
                 <div class="form-actions">
                     <button type="submit" class="btn btn-primary">Save Changes</button>
-                    <a href="/db/data?table={table_name}" class="btn">Cancel</a>
+                    <a href="{back_url}" class="btn">Cancel</a>
                 </div>
             </form>
         </div>
@@ -267,7 +336,7 @@ def register_routes(http_api, template, data_service, connection_service, logger
         html = template.render(content, title="Edit Record", active_menu="db_data")
         return http_api.HTMLResponse(content=html)
     
-    @http_api.post("/db/data/{table_name}/edit/{record_id}")
+    @http_api.post("/db/data/{table_name}/edit/{record_id:path}")
     async def edit_record_submit(request: http_api.Request):
         """Handle edit record form submission."""
         table_name = request.path_params["table_name"]
@@ -278,26 +347,32 @@ def register_routes(http_api, template, data_service, connection_service, logger
         for key, value in form.items():
             data[key] = value
         
-        result = await data_service.update_record(table_name, int(record_id), data)
+        _, pk_column, key = await record_key(table_name, record_id)
+        if key is None:
+            return failure_page("Update Failed", table_name, f"Invalid record key: {record_id}")
+        result = await data_service.update_record(table_name, key, data, pk_column=pk_column)
+        if not result.get("success"):
+            return failure_page("Update Failed", table_name, result.get("error"))
         
-        return http_api.RedirectResponse(url=f"/db/data?table={table_name}", status_code=303)
+        return http_api.RedirectResponse(url=f"/db/data?table={quote(table_name)}", status_code=303)
     
-    @http_api.get("/db/data/{table_name}/delete/{record_id}")
+    @http_api.get("/db/data/{table_name}/delete/{record_id:path}")
     async def delete_record_confirm(request: http_api.Request):
         """Delete record confirmation page."""
         table_name = request.path_params["table_name"]
         record_id = request.path_params["record_id"]
+        action_url = f"/db/data/{quote(table_name, safe='')}/delete/{quote(record_id, safe='')}"
         
         content = f"""
         <div class="card">
             <h1>Delete Record</h1>
-            <p class="text-danger">Are you sure you want to delete record {record_id} from {table_name}?</p>
+            <p class="text-danger">Are you sure you want to delete record {escape(record_id)} from {escape(table_name)}?</p>
         </div>
         
         <div class="card">
-            <form action="/db/data/{table_name}/delete/{record_id}" method="POST">
+            <form action="{action_url}" method="POST">
                 <button type="submit" class="btn btn-danger">Yes, Delete</button>
-                <a href="/db/data?table={table_name}" class="btn">Cancel</a>
+                <a href="/db/data?table={quote(table_name, safe='')}" class="btn">Cancel</a>
             </form>
         </div>
         """
@@ -305,12 +380,17 @@ def register_routes(http_api, template, data_service, connection_service, logger
         html = template.render(content, title="Delete Record", active_menu="db_data")
         return http_api.HTMLResponse(content=html)
     
-    @http_api.post("/db/data/{table_name}/delete/{record_id}")
+    @http_api.post("/db/data/{table_name}/delete/{record_id:path}")
     async def delete_record_submit(request: http_api.Request):
         """Handle delete record form submission."""
         table_name = request.path_params["table_name"]
         record_id = request.path_params["record_id"]
         
-        result = await data_service.delete_record(table_name, int(record_id))
+        _, pk_column, key = await record_key(table_name, record_id)
+        if key is None:
+            return failure_page("Delete Failed", table_name, f"Invalid record key: {record_id}")
+        result = await data_service.delete_record(table_name, key, pk_column=pk_column)
+        if not result.get("success"):
+            return failure_page("Delete Failed", table_name, result.get("error"))
         
-        return http_api.RedirectResponse(url=f"/db/data?table={table_name}", status_code=303)
+        return http_api.RedirectResponse(url=f"/db/data?table={quote(table_name)}", status_code=303)
@@ -8,7 +8,8 @@ This module provides data-related operations:
 - Delete records
 - Get table schema for form generation
 """
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class DataEditorService:
@@ -66,6 +67,39 @@ class DataEditorService:
             self._log(f"Error getting table schema: {e}", "ERROR")
             return []
     
+    @staticmethod
+    def primary_key_column(schema: List[dict]) -> Optional[str]:
+        """Name of the primary key column, or None unless the key is a single column."""
+        pk_columns = [col["name"] for col in schema if col.get("primary_key")]
+        return pk_columns[0] if len(pk_columns) == 1 else None
+    
+    @classmethod
+    def record_key(cls, schema: List[dict], record_id: str) -> Tuple[str, Any]:
+        """
+        Column and typed value that address a record, from its key as sent in a URL.
+        
+        The column is the single-column primary key, else "id". The value is
+        converted to the column's type, since drivers such as asyncpg reject a
+        string bound to a numeric column.
+        
+        Raises:
+            ValueError: If the value does not fit the column's type
+        """
+        pk_column = cls.primary_key_column(schema) or "id"
+        col_type = next(
+            (str(col.get("type") or "").upper() for col in schema if col["name"] == pk_column), ""
+        )
+        if "INT" in col_type:
+            return pk_column, int(record_id)
+        if "NUMERIC" in col_type or "DECIMAL" in col_type:
+            try:
+                return pk_column, Decimal(record_id)
+            except ArithmeticError:
+                raise ValueError(f"Invalid decimal key: {record_id!r}")
+        if "REAL" in col_type or "FLOAT" in col_type or "DOUBLE" in col_type:
+            return pk_column, float(record_id)
+        return pk_column, record_id
+    
     async def get_table_data(
         self, 
         table_name: str, 
@@ -102,7 +136,58 @@ class DataEditorService:
             self._log(f"Error getting table data: {e}", "ERROR")
             return {"rows": [], "total": 0}
     
-    async def get_record(self, table_name: str, record_id: int, pk_column: str = "id") -> Optional[Dict[str, Any]]:
+    async def get_table_page(
+        self,
+        table_name: str,
+        limit: int = 50,
+        after: Any = None,
+        before: Any = None,
+        page: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a table for browsing, without counting the table.
+        
+        Tables with a single-column primary key are paged by key: ``after``
+        and ``before`` are the keys bounding the neighbouring pages. Other
+        tables fall back to OFFSET paging by ``page``. One extra row is
+        fetched to tell whether another page follows.
+        
+        Returns:
+            {"rows", "key" (paging column or None), "has_prev", "has_next", "page"}
+        """
+        result = {"rows": [], "key": None, "has_prev": False, "has_next": False, "page": page}
+        conn_name = self._active_connection
+        if not conn_name or not self._db_service.has_connection(conn_name):
+            return result
+        
+        try:
+            conn = self._db_service.get_connection(conn_name)
+            schema = await self._db_service.get_table_schema(table_name, conn_name)
+            key = self.primary_key_column(schema)
+            
+            if key:
+                rows = await conn.find_page(table_name, key, after=after, before=before, limit=limit + 1)
+                more = len(rows) > limit
+                if before is not None:
+                    # Walking backwards: the extra row is the oldest one
+                    rows = rows[1:] if more else rows
+                    has_prev, has_next = more, True
+                else:
+                    rows = rows[:limit]
+                    has_prev, has_next = after is not None, more
+                result.update(key=key, has_prev=has_prev, has_next=has_next)
+            else:
+                rows = await conn.find_many(table_name, limit=limit + 1, offset=(page - 1) * limit)
+                result.update(has_prev=page > 1, has_next=len(rows) > limit)
+                rows = rows[:limit]
+            
+            result["rows"] = rows
+            return result
+        except Exception as e:
+            self._log(f"Error getting table data: {e}", "ERROR")
+            return result
+    
+    async def get_record(self, table_name: str, record_id: Any, pk_column: str = "id") -> Optional[Dict[str, Any]]:
         """Get a single record by ID."""
         conn_name = self._active_connection
         if not conn_name or not self._db_service.has_connection(conn_name):
@@ -144,7 +229,7 @@ class DataEditorService:
     async def update_record(
         self, 
         table_name: str, 
-        record_id: int, 
+        record_id: Any, 
         data: Dict[str, Any],
         pk_column: str = "id"
     ) -> Dict[str, Any]:
@@ -172,7 +257,7 @@ class DataEditorService:
             self._log(f"Error updating record: {error_msg}", "ERROR")
             return {"success": False, "error": error_msg}
     
-    async def delete_record(self, table_name: str, record_id: int, pk_column: str = "id") -> Dict[str, Any]:
+    async def delete_record(self, table_name: str, record_id: Any, pk_column: str = "id") -> Dict[str, Any]:
         """Delete a record."""
         conn_name = self._active_connection
         if not conn_name or not self._db_service.has_connection(conn_name):
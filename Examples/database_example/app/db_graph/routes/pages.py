@@ -23,7 +23,7 @@ def register_routes(http_api, template, graph_service, connection_service, logge
     @http_api.get("/db/graph/data")
     async def graph_data(request: http_api.Request):
         data = await graph_service.get_graph_data()
-        return http_api.JSONResponse(content=data)
+        return http_api.FastJSONResponse(data)
 
     @http_api.get("/db/graph")
     async def graph_page(request: http_api.Request):
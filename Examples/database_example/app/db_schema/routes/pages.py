@@ -5,6 +5,12 @@ This module provides routes for:
 - Index management
 - Foreign key management
 """
+from html import escape
+
+
+# <option> element for the table selectors, formatted once per table
+_OPTION_TMPL = '<option value="{value}">{label}</option>'
+_format_option = _OPTION_TMPL.format
 
 
 def register_routes(http_api, template, schema_service, connection_service, logger):
@@ -26,13 +32,12 @@ def register_routes(http_api, template, schema_service, connection_service, logg
         tables = await schema_service.list_tables()
         indexes = await schema_service.list_indexes()
         foreign_keys = await schema_service.list_foreign_keys()
-        logs = connection_service.get_logs(20)
         
         # Build indexes HTML
         if indexes:
-            index_rows = ""
+            index_rows = []
             for idx in indexes:
-                index_rows += f"""
+                index_rows.append(f"""
                 <tr>
                     <td>{idx.get('name', '-')}</td>
                     <td>{idx.get('table', '-')}</td>
@@ -42,12 +47,12 @@ def register_routes(http_api, template, schema_service, connection_service, logg
                         <button onclick="dropIndex('{idx.get('name')}', '{idx.get('table')}')" class="btn btn-sm btn-danger">Drop</button>
                     </td>
                 </tr>
-                """
+                """)
             indexes_html = f"""
             <div class="table-wrapper">
                 <table>
                     <thead><tr><th>Name</th><th>Table</th><th>Columns</th><th>Unique</th><th>Actions</th></tr></thead>
-                    <tbody>{index_rows}</tbody>
+                    <tbody>{"".join(index_rows)}</tbody>
                 </table>
             </div>
             """
@@ -56,9 +61,9 @@ def register_routes(http_api, template, schema_service, connection_service, logg
         
         # Build foreign keys HTML
         if foreign_keys:
-            fk_rows = ""
+            fk_rows = []
             for fk in foreign_keys:
-                fk_rows += f"""
+                fk_rows.append(f"""
                 <tr>
                     <td>{fk.get('name', '-')}</td>
                     <td>{fk.get('table', '-')}</td>
@@ -69,34 +74,26 @@ def register_routes(http_api, template, schema_service, connection_service, logg
                         <button onclick="dropForeignKey('{fk.get('name')}', '{fk.get('table')}')" class="btn btn-sm btn-danger">Drop</button>
                     </td>
                 </tr>
-                """
+                """)
             fk_html = f"""
             <div class="table-wrapper">
                 <table>
                     <thead><tr><th>Name</th><th>Table</th><th>Columns</th><th>Ref Table</th><th>Ref Columns</th><th>Actions</th></tr></thead>
-                    <tbody>{fk_rows}</tbody>
+                    <tbody>{"".join(fk_rows)}</tbody>
                 </table>
             </div>
             """
         else:
             fk_html = '<p class="text-muted">No foreign keys found.</p>'
         
-        # Build logs HTML
-        logs_html = ""
-        for log in logs:
-            level_class = f"log-{log['level'].lower()}"
-            logs_html += f"""
-            <div class="log-entry {level_class}">
-                <span class="log-time">{log['timestamp']}</span>
-                <span class="log-level">[{log['level']}]</span>
-                <span class="log-message">{log['message']}</span>
-            </div>
-            """
+        # Log entries are rendered (and escaped) once when they are logged
+        logs_html = "".join(connection_service.get_rendered_logs(20))
         
         # Build table options for forms
-        table_options = ""
-        for table in tables:
-            table_options += f'<option value="{table}">{table}</option>'
+        table_options = "".join(
+            _format_option(value=label, label=label)
+            for label in map(escape, tables)
+        )
         
         content = f"""
         <div class="card">
@@ -320,43 +317,43 @@ def register_routes(http_api, template, schema_service, connection_service, logg
     @http_api.post("/db/api/schema/index/create")
     async def api_create_index(request: http_api.Request):
         """Create an index."""
-        data = await request.json()
+        data = await http_api.read_json(request)
         result = await schema_service.create_index(
             table_name=data.get("table_name"),
             index_name=data.get("index_name"),
             columns=data.get("columns", []),
             unique=data.get("unique", False)
         )
-        return result
+        return http_api.FastJSONResponse(result)
     
     @http_api.post("/db/api/schema/index/drop")
     async def api_drop_index(request: http_api.Request):
         """Drop an index."""
-        data = await request.json()
+        data = await http_api.read_json(request)
         result = await schema_service.drop_index(
             index_name=data.get("index_name"),
             table_name=data.get("table_name")
         )
-        return result
+        return http_api.FastJSONResponse(result)
     
     @http_api.post("/db/api/schema/fk/create")
     async def api_create_fk(request: http_api.Request):
         """Add a foreign key."""
-        data = await request.json()
+        data = await http_api.read_json(request)
         result = await schema_service.add_foreign_key(
             table_name=data.get("table_name"),
             columns=data.get("columns", []),
             ref_table=data.get("ref_table"),
             ref_columns=data.get("ref_columns", [])
         )
-        return result
+        return http_api.FastJSONResponse(result)
     
     @http_api.post("/db/api/schema/fk/drop")
     async def api_drop_fk(request: http_api.Request):
         """Drop a foreign key."""
-        data = await request.json()
+        data = await http_api.read_json(request)
         result = await schema_service.drop_foreign_key(
             fk_name=data.get("fk_name"),
             table_name=data.get("table_name")
         )
-        return result
+        return http_api.FastJSONResponse(result)
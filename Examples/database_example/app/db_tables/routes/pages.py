@@ -6,6 +6,7 @@ This module provides routes for:
 - Creating and dropping tables
 - Viewing table schema and data
 """
+from urllib.parse import quote
 
 
 def register_routes(http_api, template, tables_service, connection_service, logger):
@@ -25,15 +26,14 @@ def register_routes(http_api, template, tables_service, connection_service, logg
             return http_api.HTMLResponse(content=html)
         
         tables = await tables_service.list_tables()
-        logs = connection_service.get_logs(20)
         
         # Build tables list HTML
         if tables:
-            table_rows = ""
+            table_rows = []
             for table in tables:
                 data = await tables_service.get_table_data(table, limit=1)
                 row_count = data.get("total", 0)
-                table_rows += f"""
+                table_rows.append(f"""
                 <tr>
                     <td><a href="/db/tables/{table}">{table}</a></td>
                     <td>{row_count}</td>
@@ -43,7 +43,7 @@ def register_routes(http_api, template, tables_service, connection_service, logg
                         <a href="/db/tables/{table}/drop" class="btn btn-sm btn-danger">Drop</a>
                     </td>
                 </tr>
-                """
+                """)
             
             tables_html = f"""
             <div class="table-wrapper">
@@ -55,24 +55,15 @@ def register_routes(http_api, template, tables_service, connection_service, logg
                             <th>Actions</th>
                         </tr>
                     </thead>
-                    <tbody>{table_rows}</tbody>
+                    <tbody>{"".join(table_rows)}</tbody>
                 </table>
             </div>
             """
         else:
             tables_html = '<p class="text-muted">No tables found. Create a new table or use sample tables.</p>'
         
-        # Build logs HTML
-        logs_html = ""
-        for log in logs:
-            level_class = f"log-{log['level'].lower()}"
-            logs_html += f"""
-            <div class="log-entry {level_class}">
-                <span class="log-time">{log['timestamp']}</span>
-                <span class="log-level">[{log['level']}]</span>
-                <span class="log-message">{log['message']}</span>
-            </div>
-            """
+        # Log entries are rendered (and escaped) once when they are logged
+        logs_html = "".join(connection_service.get_rendered_logs(20))
         
         content = f"""
         <div class="card">
@@ -280,18 +271,18 @@ def register_routes(http_api, template, tables_service, connection_service, logg
         
         # Build schema HTML
         if schema:
-            schema_rows = ""
+            schema_rows = []
             for col in schema:
                 pk_badge = '<span class="badge badge-primary">PK</span>' if col.get("primary_key") else ""
                 nn_badge = '<span class="badge">NOT NULL</span>' if not col.get("nullable") else ""
-                schema_rows += f"""
+                schema_rows.append(f"""
                 <tr>
                     <td>{col['name']}</td>
                     <td>{col['type']}</td>
                     <td>{pk_badge} {nn_badge}</td>
                     <td>{col.get('default') or '-'}</td>
                 </tr>
-                """
+                """)
             
             schema_html = f"""
             <div class="table-wrapper">
@@ -304,7 +295,7 @@ def register_routes(http_api, template, tables_service, connection_service, logg
                             <th>Default</th>
                         </tr>
                     </thead>
-                    <tbody>{schema_rows}</tbody>
+                    <tbody>{"".join(schema_rows)}</tbody>
                 </table>
             </div>
             """
@@ -354,7 +345,7 @@ def register_routes(http_api, template, tables_service, connection_service, logg
     async def view_table_schema(request: http_api.Request):
         """View table schema (redirect to table view)."""
         table_name = request.path_params["table_name"]
-        return http_api.RedirectResponse(url=f"/db/tables/{table_name}", status_code=303)
+        return http_api.RedirectResponse(url=f"/db/tables/{quote(table_name)}", status_code=303)
     
     @http_api.get("/db/tables/{table_name}/drop")
     async def drop_table_confirm(request: http_api.Request):
@@ -22,6 +22,7 @@ class TablesService:
     - get_database_types(): Returns database types dictionary
     - get_active_connection_name(): Returns the active connection name
     - is_connected(): Checks if there's an active connection
+    - list_tables()/invalidate_tables(): Cached table listing
     - _log: Logging function
     """
     
@@ -49,7 +50,7 @@ class TablesService:
             return []
         
         try:
-            tables = await self._db_service.get_connection(conn_name).list_tables()
+            tables = await self._connection.list_tables(conn_name)
             self._log(f"Listed {len(tables)} tables", "INFO")
             return tables
         except Exception as e:
@@ -135,6 +136,7 @@ class TablesService:
             )
             
             result = await self._db_service.get_connection(conn_name).create_table(table_def)
+            self._connection.invalidate_tables(conn_name)
             
             if result.success:
                 self._log(f"Table created: {table_name}", "INFO")
@@ -155,6 +157,7 @@ class TablesService:
         
         try:
             result = await self._db_service.get_connection(conn_name).drop_table(table_name)
+            self._connection.invalidate_tables(conn_name)
             
             if result.success:
                 self._log(f"Table dropped: {table_name}", "INFO")
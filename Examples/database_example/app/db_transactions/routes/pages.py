@@ -24,19 +24,9 @@ def register_routes(http_api, template, transaction_service, connection_service,
             return http_api.HTMLResponse(content=html)
         
         status = transaction_service.get_transaction_status()
-        logs = connection_service.get_logs(20)
         
-        # Build logs HTML
-        logs_html = ""
-        for log in logs:
-            level_class = f"log-{log['level'].lower()}"
-            logs_html += f"""
-            <div class="log-entry {level_class}">
-                <span class="log-time">{log['timestamp']}</span>
-                <span class="log-level">[{log['level']}]</span>
-                <span class="log-message">{log['message']}</span>
-            </div>
-            """
+        # Log entries are rendered (and escaped) once when they are logged
+        logs_html = "".join(connection_service.get_rendered_logs(20))
         
         status_badge = '<span class="badge badge-success">Active</span>' if status["has_active"] else '<span class="badge">Inactive</span>'
         
@@ -175,24 +165,24 @@ def register_routes(http_api, template, transaction_service, connection_service,
     async def api_begin_transaction(request: http_api.Request):
         """Begin a new transaction."""
         result = await transaction_service.begin_transaction()
-        return result
+        return http_api.FastJSONResponse(result)
     
     @http_api.post("/db/api/transactions/commit")
     async def api_commit_transaction(request: http_api.Request):
         """Commit the current transaction."""
         result = await transaction_service.commit_transaction()
-        return result
+        return http_api.FastJSONResponse(result)
     
     @http_api.post("/db/api/transactions/rollback")
     async def api_rollback_transaction(request: http_api.Request):
         """Rollback the current transaction."""
         result = await transaction_service.rollback_transaction()
-        return result
+        return http_api.FastJSONResponse(result)
     
     @http_api.post("/db/api/transactions/execute")
     async def api_execute_sql(request: http_api.Request):
         """Execute SQL query."""
-        data = await request.json()
+        data = await http_api.read_json(request)
         sql = data.get("sql", "")
         params = data.get("params", [])
         result = await transaction_service.execute_sql(sql, params)
@@ -17,6 +17,7 @@ class TransactionsService:
     - get_database_service(): Returns the DatabaseService instance
     - get_active_connection_name(): Returns the active connection name
     - is_connected(): Checks if there's an active connection
+    - invalidate_tables(): Forgets a cached table listing
     - _log: Logging function
     """
     
@@ -68,6 +69,7 @@ class TransactionsService:
                 await self._transaction_obj.commit()
                 self._transaction_obj = None
                 self._active_transaction = None
+                self._connection.invalidate_tables(conn_name)
                 self._log(f"Transaction committed on {conn_name}", "INFO")
                 return {"success": True, "message": "Transaction committed"}
             else:
@@ -88,6 +90,8 @@ class TransactionsService:
                 await self._transaction_obj.rollback()
                 self._transaction_obj = None
                 self._active_transaction = None
+                # Rolled-back DDL changes the tables too (SQLite, PostgreSQL)
+                self._connection.invalidate_tables(conn_name)
                 self._log(f"Transaction rolled back on {conn_name}", "INFO")
                 return {"success": True, "message": "Transaction rolled back"}
             else:
@@ -118,6 +122,8 @@ class TransactionsService:
                 }
             else:
                 result = await conn.execute(sql, params or [])
+                # The statement may have created, dropped or renamed tables
+                self._connection.invalidate_tables(conn_name)
                 self._log(f"Executed SQL: {sql[:100]}...", "INFO")
                 return {
                     "success": True,
@@ -4,6 +4,13 @@ Main App Module - Home and About pages.
 from massir.core.interfaces import IModule, ModuleContext
 from .routes.pages import register_routes
 
+# Menu items registered on start
+_MENUS = (
+    {"id": "main_app_home", "label": "Home", "url": "/", "icon": "🏠", "order": 0},
+    {"id": "main_app_about", "label": "About", "url": "/about", "icon": "ℹ️", "order": 100},
+)
+_MENU_IDS = tuple(menu["id"] for menu in _MENUS)
+
 
 class MainAppModule(IModule):
     """Main application module providing home and about pages."""
@@ -27,24 +34,10 @@ class MainAppModule(IModule):
         
         # Register menu items
         if self._menu_manager:
-            self._menu_manager.register_menu(
-                id="main_app_home",
-                label="Home",
-                url="/",
-                icon="🏠",
-                order=0
-            )
-            self._menu_manager.register_menu(
-                id="main_app_about",
-                label="About",
-                url="/about",
-                icon="ℹ️",
-                order=100
-            )
+            self._menu_manager.register_menus(_MENUS)
     
     async def stop(self, context: ModuleContext):
         """Stop the main app module."""
         # Unregister menu items
         if self._menu_manager:
-            self._menu_manager.unregister_menu("main_app_home")
-            self._menu_manager.unregister_menu("main_app_about")
+            self._menu_manager.unregister_menus(_MENU_IDS)
@@ -1,15 +1,11 @@
 """
 Main App Routes - Home and About pages.
 """
+from functools import partial
 
-
-def register_routes(http_api, template, logger):
-    """Register main app routes."""
-    
-    @http_api.get("/")
-    async def home(request: http_api.Request):
-        """Home page."""
-        content = """
+# Page bodies are constant, so they live at module scope and the template
+# service hands back a prebuilt response until the menu changes.
+HOME_CONTENT = """
         <div class="card">
             <h1>Welcome to Database Example</h1>
             <p class="text-muted">A demonstration of the Massir Framework database module capabilities.</p>
@@ -68,14 +64,9 @@ def register_routes(http_api, template, logger):
                 </a>
             </div>
         </div>
-        """
-        html = template.render(content, title="Home", active_menu="main_app_home")
-        return http_api.HTMLResponse(content=html)
-    
-    @http_api.get("/about")
-    async def about(request: http_api.Request):
-        """About page."""
-        content = """
+"""
+
+ABOUT_CONTENT = """
         <div class="card">
             <h1>About Database Example</h1>
             <p class="text-muted">Learn more about this application and the Massir Framework.</p>
@@ -136,6 +127,22 @@ def register_routes(http_api, template, logger):
                 </div>
             </div>
         </div>
-        """
-        html = template.render(content, title="About", active_menu="main_app_about")
-        return http_api.HTMLResponse(content=html)
+"""
+
+
+async def home(request, template):
+    """Home page."""
+    return template.cached_response(HOME_CONTENT, title="Home", active_menu="main_app_home")
+
+
+async def about(request, template):
+    """About page."""
+    return template.cached_response(ABOUT_CONTENT, title="About", active_menu="main_app_about")
+
+
+def register_routes(http_api, template, logger):
+    """Register main app routes."""
+    # Plain routes: the handlers take the request directly and get their
+    # dependencies bound once here
+    http_api.add_route("/", partial(home, template=template), methods=["GET"])
+    http_api.add_route("/about", partial(about, template=template), methods=["GET"])
@@ -23,6 +23,8 @@ class TemplateServiceModule(IModule):
         self.logger = None
         self.menu_manager = None
         self.renderer = None
+        # (content, title, active_menu) -> (cached body, prebuilt response)
+        self._responses = {}
     
     async def load(self, context: ModuleContext):
         """Get services and initialize."""
@@ -94,6 +96,43 @@ class TemplateServiceModule(IModule):
         """Render a page with the base template."""
         return self.renderer.render(content, title, active_menu, additional_css, additional_js)
     
+    def render_shell(self, title: str = "", active_menu: str = "",
+                     additional_css: str = "", additional_js: str = "") -> tuple:
+        """
+        Render the base template without content, as (head, tail).
+        
+        For pages that stream their content between the two parts.
+        """
+        return self.renderer.render_shell(title, active_menu, additional_css, additional_js)
+    
+    def render_shell_encoded(self, title: str = "", active_menu: str = "",
+                             additional_css: str = "", additional_js: str = "") -> tuple:
+        """
+        Render the base template without content, as UTF-8 (head, tail).
+        
+        For pages that assemble their response body as bytes.
+        """
+        return self.renderer.render_shell_encoded(title, active_menu, additional_css, additional_js)
+    
+    def render_cached(self, content: str, title: str = "", active_menu: str = "") -> bytes:
+        """Render a page with constant content as UTF-8, cached until the menu changes."""
+        return self.renderer.render_cached(content, title, active_menu)
+    
+    def cached_response(self, content: str, title: str = "", active_menu: str = ""):
+        """
+        Return a shared prebuilt HTML response for a page with constant content.
+        
+        The response is rebuilt only when the cached page body changes,
+        i.e. after the menu changed.
+        """
+        body = self.renderer.render_cached(content, title, active_menu)
+        key = (content, title, active_menu)
+        cached = self._responses.get(key)
+        if cached is None or cached[0] is not body:
+            cached = (body, self.http_api.CachedHTMLResponse(body))
+            self._responses[key] = cached
+        return cached[1]
+    
     def render_card(self, title: str, content: str, actions: str = "") -> str:
         """Render a card component."""
         return self.renderer.render_card(title, content, actions)
@@ -6,8 +6,15 @@ This module provides services for:
 - Template rendering with unified theme
 - Static file serving
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
+
+# Sort keys used when building menus
+_BY_ORDER = attrgetter("order")
+_BY_ORDER_KEY = itemgetter("order")
+# Rendered shells kept before the shell cache is reset
+SHELL_CACHE_SIZE = 128
 
 
 @dataclass
@@ -47,6 +54,8 @@ class MenuManager:
             'postgresql': {'label': 'PostgreSQL', 'icon': '🐘', 'class': 'postgresql', 'order': 20},
             'mysql': {'label': 'MySQL', 'icon': '🐬', 'class': 'mysql', 'order': 30},
         }
+        # Incremented on every change so cached pages know when to re-render
+        self.version = 0
     
     def register_group(self, group_id: str, label: str, icon: str = "", css_class: str = "", order: int = 100):
         """Register a new menu group."""
@@ -56,6 +65,7 @@ class MenuManager:
             'class': css_class or group_id,
             'order': order
         }
+        self.version += 1
     
     def register_menu(self, id: str, label: str, url: str, 
                       icon: str = "", order: int = 100, parent_id: Optional[str] = None,
@@ -81,11 +91,31 @@ class MenuManager:
             group=group
         )
         self._items[id] = item
+        self.version += 1
     
     def unregister_menu(self, id: str):
         """Remove a menu item by ID."""
         if id in self._items:
             del self._items[id]
+            self.version += 1
+    
+    def register_menus(self, menus):
+        """Register several menu items with a single version bump.
+        
+        Args:
+            menus: Iterable of dicts with register_menu keyword arguments
+        """
+        for menu in menus:
+            self._items[menu["id"]] = MenuItem(**menu)
+        self.version += 1
+    
+    def unregister_menus(self, ids):
+        """Remove several menu items by ID with a single version bump."""
+        removed = False
+        for id in ids:
+            removed = self._items.pop(id, None) is not None or removed
+        if removed:
+            self.version += 1
     
     def get_menu(self) -> List[MenuItem]:
         """Get all menu items sorted by order."""
@@ -97,7 +127,7 @@ class MenuManager:
             item.children = self._get_children(item.id)
         
         # Sort by order
-        root_items.sort(key=lambda x: x.order)
+        root_items.sort(key=_BY_ORDER)
         return root_items
     
     def _get_children(self, parent_id: str) -> List[MenuItem]:
@@ -105,7 +135,7 @@ class MenuManager:
         children = [item for item in self._items.values() if item.parent_id == parent_id]
         for child in children:
             child.children = self._get_children(child.id)
-        children.sort(key=lambda x: x.order)
+        children.sort(key=_BY_ORDER)
         return children
     
     def get_menu_dict(self) -> List[dict]:
@@ -135,7 +165,7 @@ class MenuManager:
         
         # Sort items within each group
         for group_id in grouped:
-            grouped[group_id].sort(key=lambda x: x['order'])
+            grouped[group_id].sort(key=_BY_ORDER_KEY)
         
         return grouped
     
@@ -151,16 +181,69 @@ class TemplateRenderer:
         self.menu_manager = menu_manager
         self._site_name = "Database Example"
         self._site_description = "Massir Framework Database Example"
+        # (content, title, active_menu) -> (menu version, UTF-8 encoded page)
+        self._page_cache: Dict[Tuple[str, str, str], Tuple[int, bytes]] = {}
+        # (title, active_menu, css, js) -> (menu version, (head, tail), UTF-8 (head, tail))
+        self._shell_cache: Dict[Tuple[str, str, str, str], Tuple[int, Tuple[str, str], Tuple[bytes, bytes]]] = {}
     
     def set_site_info(self, name: str, description: str = ""):
         """Set site information."""
         self._site_name = name
         self._site_description = description
+        self._page_cache.clear()
+        self._shell_cache.clear()
+    
+    def render_cached(self, content: str, title: str = "", active_menu: str = "") -> bytes:
+        """
+        Render a page with constant content, reusing it until the menu changes.
+        
+        The page is returned already encoded so responses skip the
+        per-request UTF-8 encode.
+        """
+        key = (content, title, active_menu)
+        version = self.menu_manager.version
+        cached = self._page_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, self.render(content, title, active_menu).encode("utf-8"))
+            self._page_cache[key] = cached
+        return cached[1]
     
     def render(self, content: str, title: str = "", active_menu: str = "", 
                additional_css: str = "", additional_js: str = "") -> str:
         """Render a page with the base template."""
-        return f"""<!DOCTYPE html>
+        head, tail = self._shell(title, active_menu, additional_css, additional_js)
+        return head + content + tail
+    
+    def render_shell(self, title: str = "", active_menu: str = "",
+                     additional_css: str = "", additional_js: str = "") -> Tuple[str, str]:
+        """Render the base template around the content slot, as (head, tail)."""
+        return self._shell_entry(title, active_menu, additional_css, additional_js)[1]
+    
+    def render_shell_encoded(self, title: str = "", active_menu: str = "",
+                             additional_css: str = "", additional_js: str = "") -> Tuple[bytes, bytes]:
+        """Render the base template around the content slot, as UTF-8 (head, tail)."""
+        return self._shell_entry(title, active_menu, additional_css, additional_js)[2]
+    
+    def _shell(self, title: str, active_menu: str, additional_css: str,
+               additional_js: str) -> Tuple[str, str]:
+        """Get the base template around the content slot, as (head, tail)."""
+        return self._shell_entry(title, active_menu, additional_css, additional_js)[1]
+    
+    def _shell_entry(self, title: str, active_menu: str, additional_css: str,
+                     additional_js: str) -> Tuple[int, Tuple[str, str], Tuple[bytes, bytes]]:
+        """
+        Get the cached shell entry: (menu version, (head, tail), UTF-8 (head, tail)).
+        
+        The layout only depends on its arguments, the site info and the
+        menu, so it is rendered and encoded once per menu version and reused.
+        """
+        key = (title, active_menu, additional_css, additional_js)
+        version = self.menu_manager.version
+        cached = self._shell_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached
+        
+        head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -183,7 +266,8 @@ class TemplateRenderer:
     
     <main class="main">
         <div class="container">
-            {content}
+            """
+        tail = f"""
         </div>
     </main>
     
@@ -196,6 +280,11 @@ class TemplateRenderer:
     {additional_js}
 </body>
 </html>"""
+        cached = (version, (head, tail), (head.encode("utf-8"), tail.encode("utf-8")))
+        if len(self._shell_cache) >= SHELL_CACHE_SIZE:
+            self._shell_cache.clear()
+        self._shell_cache[key] = cached
+        return cached
     
     def _render_menu(self, active_menu: str) -> str:
         """Render menu HTML with grouping support."""
@@ -246,19 +335,19 @@ class TemplateRenderer:
         header_class = f"menu-group-header {group_info.get('class', '')}"
         
         # Render items
-        items_html = f'<li class="{header_class}">{group_info["label"]}</li>'
+        items_html = [f'<li class="{header_class}">{group_info["label"]}</li>']
         for item in items:
             item_active = "active" if item['id'] == active_menu else ""
             item_icon = f"<span class='icon'>{item['icon']}</span>" if item.get('icon') else ""
-            items_html += f"""
+            items_html.append(f"""
             <li class="{item_active}">
                 <a href="{item['url']}">{item_icon}{item['label']}</a>
-            </li>"""
+            </li>""")
         
         return f"""
         <li class="menu-group {active_class}">
             <a href="#">{icon}{group_info['label']}</a>
-            <ul class="submenu">{items_html}</ul>
+            <ul class="submenu">{"".join(items_html)}</ul>
         </li>"""
     
     def _render_submenu(self, children: List[dict], active_menu: str) -> str:
@@ -292,10 +381,7 @@ class TemplateRenderer:
         
         rows_html = []
         for row in rows:
-            cells = ""
-            for col in headers:
-                value = row.get(col, '')
-                cells += f"<td>{value}</td>"
+            cells = "".join(f"<td>{row.get(col, '')}</td>" for col in headers)
             rows_html.append(f"<tr>{cells}</tr>")
         
         return f"""
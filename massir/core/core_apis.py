@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class CoreLoggerAPI(ABC):
@@ -22,6 +22,40 @@ class CoreLoggerAPI(ABC):
         """
         pass
 
+    def enabled_for(self, level: str = "INFO", tag: Optional[str] = None) -> bool:
+        """
+        Check whether a message at this level/tag would be emitted.
+
+        Callers use this to skip building expensive messages that
+        would be filtered out anyway.
+
+        Args:
+            level: Log level
+            tag: Optional tag
+
+        Returns:
+            True if the message would be logged
+        """
+        return True
+
+    def log_many(self, messages: Iterable[str], level: str = "INFO", tag: Optional[str] = None, **kwargs):
+        """
+        Log several messages with the same level and tag.
+
+        Loggers that write to a stream can override this to emit all
+        messages in one write.
+
+        Args:
+            messages: Messages to log, in order
+            level: Log level
+            tag: Optional tag for filtering
+            **kwargs: Additional keyword arguments passed to log()
+        """
+        if not self.enabled_for(level, tag):
+            return
+        for message in messages:
+            self.log(message, level, tag, **kwargs)
+
 
 class CoreConfigAPI(ABC):
     """
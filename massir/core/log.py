@@ -3,7 +3,7 @@
 Logging functions and classes.
 """
 import os
-from typing import Optional
+from typing import Iterable, Optional
 from massir.core.core_apis import CoreLoggerAPI, CoreConfigAPI
 
 
@@ -146,6 +146,19 @@ class DefaultLogger(CoreLoggerAPI):
 
         return True
 
+    def enabled_for(self, level: str = "INFO", tag: Optional[str] = None) -> bool:
+        """
+        Check whether a message at this level/tag would be emitted.
+
+        Args:
+            level: Log level
+            tag: Log tag
+
+        Returns:
+            True if the message would be logged
+        """
+        return self._should_log(level, tag)
+
     def log(self, message: str, level: str = "INFO", tag: Optional[str] = None, **kwargs):
         """
         Log message with color support.
@@ -159,6 +172,36 @@ class DefaultLogger(CoreLoggerAPI):
         if not self._should_log(level, tag):
             return
 
+        print(self._format(message, level))
+
+    def log_many(self, messages: Iterable[str], level: str = "INFO", tag: Optional[str] = None, **kwargs):
+        """
+        Log several messages with a single filter check and a single write.
+
+        Args:
+            messages: Messages to log, in order
+            level: Log level
+            tag: Log tag
+            **kwargs: Additional keyword arguments (ignored, as in log())
+        """
+        if not self._should_log(level, tag):
+            return
+
+        lines = [self._format(message, level) for message in messages]
+        if lines:
+            print("\n".join(lines))
+
+    def _format(self, message: str, level: str) -> str:
+        """
+        Format one message with the configured template and color.
+
+        Args:
+            message: Log message
+            level: Log level
+
+        Returns:
+            Colored log line
+        """
         if os.name == 'nt':
             os.system('')
 
@@ -174,4 +217,4 @@ class DefaultLogger(CoreLoggerAPI):
         color_code_start = f'\033[{color_code}m'
         reset_code = '\033[0m'
 
-        print(f"{color_code_start}{formatted_msg}{reset_code}")
+        return f"{color_code_start}{formatted_msg}{reset_code}"
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 
 class ModuleRegistry:
@@ -38,6 +38,21 @@ class ModuleRegistry:
         """
         return self._services.get(key)
 
+    def get_many(self, *keys: str) -> Tuple[Optional[Any], ...]:
+        """
+        Retrieve several services at once.
+
+        Args:
+            *keys: The service identifiers
+
+        Returns:
+            Tuple of service instances in key order, None for missing keys
+
+        Usage:
+            http_api, logger = context.services.get_many("http_api", "core_logger")
+        """
+        return tuple(map(self._services.get, keys))
+
     def has(self, key: str) -> bool:
         """
         Check if a service is registered.
@@ -3,5 +3,9 @@ from .http import HTTPAPI
 from .router import RouterAPI
 from .net import NetAPI
 from .server import ServerAPI, ServerConfig, ServerStatus
+from .session import CachedSessionMiddleware, CachedTimestampSigner
 
-__all__ = ['HTTPAPI', 'RouterAPI', 'NetAPI', 'ServerAPI', 'ServerConfig', 'ServerStatus']
+__all__ = [
+    'HTTPAPI', 'RouterAPI', 'NetAPI', 'ServerAPI', 'ServerConfig', 'ServerStatus',
+    'CachedSessionMiddleware', 'CachedTimestampSigner'
+]
@@ -4,18 +4,181 @@ High-performance HTTP API abstraction for FastAPI.
 This module provides a thin wrapper around FastAPI to avoid performance overhead
 while hiding FastAPI imports from consuming modules.
 """
-from typing import Any, Callable, Dict, List, Optional, Union, TypeVar, Generic
+import hashlib
+import json
+import mimetypes
+import stat
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TypeVar, Generic
 from functools import wraps
 from dataclasses import dataclass
 
+import anyio
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import FastAPI types to expose to consumers
 from fastapi import Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 
 
 T = TypeVar('T')
 
+# JSON decoder for request bodies: orjson when installed, else the stdlib
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse that encodes with orjson when it is installed.
+
+    Falls back to the standard JSONResponse encoding otherwise. Returning
+    it from a route also skips FastAPI's ``jsonable_encoder`` pass, so the
+    content must already be made of plain JSON types.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
+
+
+class CachedHTMLResponse(Response):
+    """
+    Prebuilt HTML response that can be returned from many requests.
+
+    The body is encoded and the headers are assembled once, at
+    construction. Every send hands out a fresh copy of the header list,
+    because middleware (sessions, gzip) edits that list in place; the
+    instance itself is never modified and can be shared.
+    """
+
+    media_type = "text/html"
+
+    def __init__(self, content: Union[str, bytes], status_code: int = 200,
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Build the response.
+
+        Args:
+            content: HTML body as text or UTF-8 bytes
+            status_code: HTTP status code
+            headers: Extra response headers
+        """
+        super().__init__(content=content, status_code=status_code, headers=headers)
+        self.raw_headers = tuple(self.raw_headers)
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": list(self.raw_headers),
+        })
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that keeps small files in memory.
+
+    Each file is read once and served from memory with a content ETag,
+    answering ``If-None-Match`` with ``304 Not Modified``. Cached entries
+    are re-checked against the file's mtime at most every ``revalidate``
+    seconds, so edits still show up without a disk stat per request.
+    Directories, missing paths and files larger than ``max_file_size``
+    fall through to the regular StaticFiles handling.
+    """
+
+    def __init__(self, *args, max_age: int = 3600, revalidate: float = 2.0,
+                 max_file_size: int = 1024 * 1024, **kwargs):
+        """
+        Initialize cached static files.
+
+        Args:
+            *args: StaticFiles positional arguments
+            max_age: Cache-Control max-age sent to clients, in seconds
+            revalidate: Seconds between mtime checks for a cached file
+            max_file_size: Largest file size kept in memory, in bytes
+            **kwargs: StaticFiles keyword arguments (directory, html, ...)
+        """
+        super().__init__(*args, **kwargs)
+        self.max_age = max_age
+        self.revalidate = revalidate
+        self.max_file_size = max_file_size
+        self._cache_control = f"public, max-age={max_age}"
+        # path -> (mtime, body, etag, media_type, checked_at)
+        self._cache: Dict[str, Tuple[float, bytes, str, str, float]] = {}
+
+    async def get_response(self, path: str, scope) -> Response:
+        """
+        Return a response for the requested path, preferring the memory cache.
+
+        Args:
+            path: Path relative to the mounted directory
+            scope: ASGI scope
+
+        Returns:
+            Response object
+        """
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        entry = self._cache.get(path)
+        now = time.monotonic()
+        if entry is None or now - entry[4] > self.revalidate:
+            entry = await self._load(path, entry, now)
+            if entry is None:
+                return await super().get_response(path, scope)
+
+        _, body, etag, media_type, _ = entry
+        headers = {"etag": etag, "cache-control": self._cache_control}
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        if scope["method"] == "HEAD":
+            headers["content-length"] = str(len(body))
+            return Response(media_type=media_type, headers=headers)
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    async def _load(self, path: str, entry, now: float):
+        """
+        Refresh or create the cache entry for a path.
+
+        Args:
+            path: Path relative to the mounted directory
+            entry: Current cache entry or None
+            now: Monotonic timestamp of this check
+
+        Returns:
+            Cache entry tuple, or None when the path should not be cached
+        """
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if (
+            stat_result is None
+            or not stat.S_ISREG(stat_result.st_mode)
+            or stat_result.st_size > self.max_file_size
+        ):
+            self._cache.pop(path, None)
+            return None
+
+        if entry is not None and entry[0] == stat_result.st_mtime:
+            entry = entry[:4] + (now,)
+        else:
+            body = await anyio.Path(full_path).read_bytes()
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+            entry = (stat_result.st_mtime, body, etag, media_type, now)
+
+        self._cache[path] = entry
+        return entry
+
 
 @dataclass
 class HTTPResponse:
@@ -160,6 +323,50 @@ class HTTPAPI:
         """
         return self._app.websocket(path, **kwargs)
     
+    def add_route(self, path: str, endpoint: Callable, methods: List[str] = None,
+                  name: str = None, include_in_schema: bool = False):
+        """
+        Register a plain request handler.
+
+        The endpoint is called with the request object and must return a
+        response. No parameter parsing or dependency injection runs, so
+        this is the cheapest route type for hand-built pages.
+
+        Args:
+            path: Route path
+            endpoint: Async callable taking the request
+            methods: HTTP methods (defaults to GET)
+            name: Optional route name
+            include_in_schema: Whether to list the route in the OpenAPI schema
+
+        Usage:
+            async def index(request):
+                return http_api.HTMLResponse("<h1>Home</h1>")
+
+            http_api.add_route("/", index, methods=["GET"])
+        """
+        self._app.add_route(
+            path,
+            endpoint,
+            methods=methods,
+            name=name,
+            include_in_schema=include_in_schema
+        )
+
+    async def read_json(self, request) -> Any:
+        """
+        Parse the JSON body of a request.
+
+        Uses orjson when it is installed, the stdlib json module otherwise.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            Decoded JSON value
+        """
+        return json_loads(await request.body())
+
     def include_router(self, router, **kwargs):
         """
         Include a router in the FastAPI app.
@@ -270,7 +477,11 @@ class HTTPAPI:
     # Expose FastAPI types for consumers
     Request = Request
     HTMLResponse = HTMLResponse
+    CachedHTMLResponse = CachedHTMLResponse
     JSONResponse = JSONResponse
+    FastJSONResponse = FastJSONResponse
     RedirectResponse = RedirectResponse
     PlainTextResponse = PlainTextResponse
+    StreamingResponse = StreamingResponse
     StaticFiles = StaticFiles
+    CachedStaticFiles = CachedStaticFiles
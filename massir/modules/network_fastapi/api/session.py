@@ -0,0 +1,93 @@
+"""
+Session middleware with an in-process cache of verified cookies.
+
+Starlette keeps sessions in a signed cookie, so the "store" lookup on
+every request is an HMAC verification of that cookie. This module caches
+the verification result per cookie value so repeat requests from the
+same client skip it.
+"""
+import time
+from typing import Dict, Tuple
+
+from itsdangerous import TimestampSigner
+from itsdangerous.exc import SignatureExpired
+from starlette.middleware.sessions import SessionMiddleware
+
+
+class CachedTimestampSigner(TimestampSigner):
+    """
+    TimestampSigner that remembers cookies it has already verified.
+
+    A cache hit still enforces ``max_age`` against the original signing
+    time, so expiry behaves exactly as without the cache. Only valid
+    signatures are cached; the cache is cleared when it reaches its size.
+    """
+
+    def __init__(self, *args, maxsize: int = 10_000, **kwargs):
+        """
+        Initialize the signer.
+
+        Args:
+            *args: TimestampSigner positional arguments
+            maxsize: Maximum number of cached cookies
+            **kwargs: TimestampSigner keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.maxsize = maxsize
+        # signed value -> (payload, signing timestamp)
+        self._verified: Dict[bytes, Tuple[bytes, int]] = {}
+
+    def unsign(self, signed_value, max_age=None, return_timestamp=False):
+        """
+        Verify a signed value, reusing earlier verifications.
+
+        Args:
+            signed_value: Signed value as produced by ``sign``
+            max_age: Maximum age in seconds, or None
+            return_timestamp: Also return the signing time
+
+        Returns:
+            The payload, or ``(payload, datetime)`` if return_timestamp is set
+        """
+        key = signed_value.encode("utf-8") if isinstance(signed_value, str) else signed_value
+        entry = self._verified.get(key)
+        if entry is None:
+            value, signed_at = super().unsign(key, return_timestamp=True)
+            entry = (value, int(signed_at.timestamp()))
+            if len(self._verified) >= self.maxsize:
+                self._verified.clear()
+            self._verified[key] = entry
+
+        value, timestamp = entry
+        if max_age is not None:
+            age = int(time.time()) - timestamp
+            if age > max_age:
+                self._verified.pop(key, None)
+                raise SignatureExpired(
+                    f"Signature age {age} > {max_age} seconds",
+                    payload=value,
+                    date_signed=self.timestamp_to_datetime(timestamp),
+                )
+
+        if return_timestamp:
+            return value, self.timestamp_to_datetime(timestamp)
+        return value
+
+
+class CachedSessionMiddleware(SessionMiddleware):
+    """
+    SessionMiddleware that caches verified session cookies in memory.
+    """
+
+    def __init__(self, app, secret_key, cache_size: int = 10_000, **kwargs):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application
+            secret_key: Secret used to sign session cookies
+            cache_size: Maximum number of cached cookies
+            **kwargs: SessionMiddleware keyword arguments
+        """
+        super().__init__(app, secret_key, **kwargs)
+        self.signer = CachedTimestampSigner(str(secret_key), maxsize=cache_size)
@@ -12,13 +12,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.sessions import SessionMiddleware
 from massir.core.interfaces import IModule
 from massir.core.core_apis import CoreLoggerAPI, CoreConfigAPI
 from .api.http import HTTPAPI
 from .api.router import RouterAPI
 from .api.net import NetAPI
 from .api.server import ServerAPI
+from .api.session import CachedSessionMiddleware
 
 
 class NetworkFastAPIModule(IModule):
@@ -94,11 +94,13 @@ class NetworkFastAPIModule(IModule):
         secret_key = self.config_api.get("fastapi_provider.session.secret_key", secrets.token_hex(32))
         session_cookie = self.config_api.get("fastapi_provider.session.cookie_name", "session")
         max_age = self.config_api.get("fastapi_provider.session.max_age", 14 * 24 * 60 * 60)  # 14 days default
+        cache_size = self.config_api.get("fastapi_provider.session.cache_size", 10_000)
         self.app.add_middleware(
-            SessionMiddleware,
+            CachedSessionMiddleware,
             secret_key=secret_key,
             session_cookie=session_cookie,
-            max_age=max_age
+            max_age=max_age,
+            cache_size=cache_size
         )
         
         # Trusted Host middleware
@@ -371,6 +371,11 @@ class CacheManager:
         """Check if caching is enabled."""
         return self._enabled
     
+    def get_stats(self, db_name: str) -> Dict[str, Any]:
+        """Get statistics for one database's cache, or {} if it has none."""
+        cache = self._caches.get(db_name)
+        return cache.get_stats() if cache else {}
+    
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all caches."""
         return {
@@ -91,6 +91,51 @@ class BaseRecordManager(ABC):
         """Count records."""
         pass
     
+    @abstractmethod
+    async def count_tables(self, tables: List[str]) -> Dict[str, int]:
+        """
+        Count the rows of several tables in one query per batch.
+        
+        The per-table counts are combined with UNION ALL, so listing N
+        tables costs one round-trip instead of N.
+        
+        Args:
+            tables: Table names
+            
+        Returns:
+            Row count per table name
+        """
+        pass
+    
+    @abstractmethod
+    async def find_page(
+        self,
+        table: str,
+        key_column: str,
+        after: Any = None,
+        before: Any = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Find one page of records by key (keyset pagination).
+        
+        Rows are ordered by ``key_column``. The page starts right after the
+        ``after`` key, or ends right before the ``before`` key; with neither
+        it is the first page. Unlike OFFSET, the database seeks to the key,
+        so every page costs the same however deep it is.
+        
+        Args:
+            table: Table name
+            key_column: Unique, ordered column to page by (usually the PK)
+            after: Key of the last row of the previous page
+            before: Key of the first row of the next page
+            limit: Maximum number of rows
+            
+        Returns:
+            Up to ``limit`` rows in ascending key order
+        """
+        pass
+    
     @abstractmethod
     async def exists(
         self, 
@@ -169,6 +169,21 @@ class DatabaseConnection:
         """Count records."""
         return await self._record.count(table, where, where_sql, where_params)
     
+    async def count_tables(self, tables: List[str]) -> Dict[str, int]:
+        """Count the rows of several tables in batched queries."""
+        return await self._record.count_tables(tables)
+    
+    async def find_page(
+        self, 
+        table: str,
+        key_column: str,
+        after: Any = None,
+        before: Any = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Find one page of records by key (keyset pagination)."""
+        return await self._record.find_page(table, key_column, after, before, limit)
+    
     async def exists(
         self, 
         table: str,
@@ -509,6 +524,13 @@ class DatabaseService:
             return self._cache_manager.get_all_stats()
         return {}
     
+    def get_cache_stats(self, connection: Optional[str] = None) -> Dict[str, Any]:
+        """Get cache statistics of one connection (uses default if None)."""
+        conn_name = connection or self._default_connection
+        if self._cache_manager and conn_name:
+            return self._cache_manager.get_stats(conn_name)
+        return {}
+    
     def enable_cache(self):
         """Enable caching."""
         if self._cache_manager:
@@ -613,6 +635,28 @@ class DatabaseService:
             table, where, where_sql, where_params
         )
     
+    async def count_tables(
+        self, 
+        tables: List[str],
+        connection: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Count the rows of several tables in batched queries."""
+        return await self.get_connection(connection).count_tables(tables)
+    
+    async def find_page(
+        self, 
+        table: str,
+        key_column: str,
+        after: Any = None,
+        before: Any = None,
+        limit: int = 50,
+        connection: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Find one page of records by key (keyset pagination)."""
+        return await self.get_connection(connection).find_page(
+            table, key_column, after, before, limit
+        )
+    
     async def execute(
         self, 
         query: str, 
@@ -9,6 +9,10 @@ from ...core.types import DatabaseType, QueryResult
 from .connection import PostgreSQLPool
 
 
+# Tables counted per UNION ALL query
+COUNT_TABLES_BATCH = 200
+
+
 class PostgreSQLRecordManager(BaseRecordManager):
     """PostgreSQL record manager implementation."""
     
@@ -39,6 +43,10 @@ class PostgreSQLRecordManager(BaseRecordManager):
         
         return " AND ".join(conditions), tuple(params)
     
+    def _quote_identifier(self, name: str) -> str:
+        """Quote a table or column name."""
+        return '"' + name.replace('"', '""') + '"'
+    
     async def insert(
         self, 
         table: str, 
@@ -216,6 +224,35 @@ class PostgreSQLRecordManager(BaseRecordManager):
         
         return await self._pool.fetch_all(sql, params)
     
+    async def find_page(
+        self,
+        table: str,
+        key_column: str,
+        after: Any = None,
+        before: Any = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Find one page of records by key (keyset pagination)."""
+        key = self._quote_identifier(key_column)
+        sql = f"SELECT * FROM {self._quote_identifier(table)}"
+        params = ()
+        
+        if before is not None:
+            sql += f" WHERE {key} < $1 ORDER BY {key} DESC"
+            params = (before,)
+        elif after is not None:
+            sql += f" WHERE {key} > $1 ORDER BY {key}"
+            params = (after,)
+        else:
+            sql += f" ORDER BY {key}"
+        sql += f" LIMIT {int(limit)}"
+        
+        rows = await self._pool.fetch_all(sql, params)
+        if before is not None:
+            # Fetched walking backwards from the key; return in key order
+            rows.reverse()
+        return rows
+    
     async def count(
         self, 
         table: str,
@@ -237,6 +274,19 @@ class PostgreSQLRecordManager(BaseRecordManager):
         result = await self._pool.fetch_value(sql, params)
         return result or 0
     
+    async def count_tables(self, tables: List[str]) -> Dict[str, int]:
+        """Count the rows of several tables in one UNION ALL query per batch."""
+        counts: Dict[str, int] = {}
+        for start in range(0, len(tables), COUNT_TABLES_BATCH):
+            batch = tables[start:start + COUNT_TABLES_BATCH]
+            sql = " UNION ALL ".join(
+                f"SELECT {index} AS idx, COUNT(*) AS cnt FROM {self._quote_identifier(table)}"
+                for index, table in enumerate(batch)
+            )
+            for row in await self._pool.fetch_all(sql):
+                counts[batch[row["idx"]]] = row["cnt"] or 0
+        return counts
+    
     async def exists(
         self, 
         table: str,
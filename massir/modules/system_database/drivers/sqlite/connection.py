@@ -12,6 +12,17 @@ from ...core.types import DatabaseConfig, QueryResult
 from ...core.exceptions import ConnectionError, PoolError, QueryError
 
 
+# Pragmas applied to file databases on connect: WAL lets readers run
+# alongside a writer, and NORMAL sync is safe under WAL while avoiding an
+# fsync per commit. Temp tables stay in memory; the page cache is 64 MB.
+FILE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+)
+
+
 class SQLiteConnection(BaseConnection):
     """SQLite connection implementation."""
     
@@ -41,6 +52,9 @@ class SQLiteConnection(BaseConnection):
             )
             # Enable foreign keys
             await self._connection.execute("PRAGMA foreign_keys = ON")
+            if self._db_path != ":memory:":
+                for pragma in FILE_PRAGMAS:
+                    await self._connection.execute(pragma)
             # Return rows as dictionaries
             self._connection.row_factory = aiosqlite.Row
             self._is_connected = True
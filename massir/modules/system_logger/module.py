@@ -1,7 +1,7 @@
 import datetime
 import os
 import re
-from typing import Optional
+from typing import Iterable, Optional
 from massir.core.interfaces import IModule
 from massir.core.core_apis import CoreLoggerAPI, CoreConfigAPI
 from massir.core.hook_types import SystemHook
@@ -144,6 +144,19 @@ class AdvancedLogger(CoreLoggerAPI):
         
         return message
 
+    def enabled_for(self, level: str = "INFO", tag: Optional[str] = None) -> bool:
+        """
+        Check whether a message at this level/tag would be emitted.
+
+        Args:
+            level: Log level
+            tag: Log tag
+
+        Returns:
+            True if the message would be logged
+        """
+        return self._should_log(level, tag)
+
     def log(self, message: str, level: str = "INFO", tag: Optional[str] = None,
             level_color: Optional[str] = None, text_color: Optional[str] = None, bracket_color: Optional[str] = None):
         """
@@ -161,6 +174,47 @@ class AdvancedLogger(CoreLoggerAPI):
         if not self._should_log(level, tag):
             return
 
+        print(self._format(message, level, tag, level_color, text_color, bracket_color))
+
+    def log_many(self, messages: Iterable[str], level: str = "INFO", tag: Optional[str] = None,
+                 level_color: Optional[str] = None, text_color: Optional[str] = None, bracket_color: Optional[str] = None):
+        """
+        Log several messages with a single filter check and a single write.
+
+        Args:
+            messages: Messages to log, in order
+            level: Log level
+            tag: Log tag for filtering
+            level_color: Custom color for level tag (use Colors class)
+            text_color: Custom color for message text (use Colors class)
+            bracket_color: Custom color for timestamp brackets (use Colors class)
+        """
+        if not self._should_log(level, tag):
+            return
+
+        lines = [
+            self._format(message, level, tag, level_color, text_color, bracket_color)
+            for message in messages
+        ]
+        if lines:
+            print("\n".join(lines))
+
+    def _format(self, message: str, level: str, tag: Optional[str],
+                level_color: Optional[str], text_color: Optional[str], bracket_color: Optional[str]) -> str:
+        """
+        Format one colored log line.
+
+        Args:
+            message: The message to log
+            level: Log level
+            tag: Log tag
+            level_color: Custom color for level tag
+            text_color: Custom color for message text
+            bracket_color: Custom color for timestamp brackets
+
+        Returns:
+            Colored log line
+        """
         if os.name == 'nt':
             os.system('')
 
@@ -200,7 +254,7 @@ class AdvancedLogger(CoreLoggerAPI):
         else:
             str_message = f"{_text_color}{formatted_message}{Colors.RESET}"
 
-        print(f"{str_time}{str_header}\t{str_message}")
+        return f"{str_time}{str_header}\t{str_message}"
 
 
 class SystemLoggerModule(IModule):
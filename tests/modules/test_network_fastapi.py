@@ -4,12 +4,15 @@ Unit tests for network_fastapi module.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import asyncio
+import json
+import time
 
 from massir.modules.network_fastapi.module import NetworkFastAPIModule
-from massir.modules.network_fastapi.api.http import HTTPAPI, HTTPResponse
+from massir.modules.network_fastapi.api.http import HTTPAPI, HTTPResponse, CachedHTMLResponse, CachedStaticFiles, FastJSONResponse
 from massir.modules.network_fastapi.api.net import NetAPI, NetworkInfo, PortInfo
 from massir.modules.network_fastapi.api.router import RouterAPI
 from massir.modules.network_fastapi.api.server import ServerAPI, ServerConfig, ServerStatus, UvicornLogHandler
+from massir.modules.network_fastapi.api.session import CachedTimestampSigner
 from massir.core.interfaces import ModuleContext
 
 
@@ -154,6 +157,20 @@ class TestHTTPAPI:
         assert response.data["message"] == "Bad request"
         assert "code" not in response.data
     
+    def test_add_route(self, http_api, mock_app):
+        """Test add_route registers a plain route on the app."""
+        async def endpoint(request):
+            return None
+
+        http_api.add_route("/page", endpoint, methods=["GET"])
+        mock_app.add_route.assert_called_once_with(
+            "/page",
+            endpoint,
+            methods=["GET"],
+            name=None,
+            include_in_schema=False
+        )
+
     def test_app_property(self, http_api, mock_app):
         """Test app property."""
         assert http_api.app == mock_app
@@ -165,7 +182,175 @@ class TestHTTPAPI:
         assert hasattr(HTTPAPI, 'JSONResponse')
         assert hasattr(HTTPAPI, 'RedirectResponse')
         assert hasattr(HTTPAPI, 'PlainTextResponse')
+        assert hasattr(HTTPAPI, 'StreamingResponse')
         assert hasattr(HTTPAPI, 'StaticFiles')
+        assert hasattr(HTTPAPI, 'CachedStaticFiles')
+        assert hasattr(HTTPAPI, 'CachedHTMLResponse')
+        assert hasattr(HTTPAPI, 'FastJSONResponse')
+    
+    @pytest.mark.asyncio
+    async def test_read_json(self, http_api):
+        """Test the request body is decoded as JSON."""
+        request = Mock()
+        
+        async def body():
+            return b'{"name": "main", "port": 5432}'
+        
+        request.body = body
+        
+        assert await http_api.read_json(request) == {"name": "main", "port": 5432}
+
+
+class TestCachedHTMLResponse:
+    """Tests for CachedHTMLResponse."""
+    
+    def test_prebuilds_body_and_headers(self):
+        """Test the body is encoded and headers built once."""
+        response = CachedHTMLResponse("<h1>Hi</h1>")
+        
+        assert response.body == b"<h1>Hi</h1>"
+        assert (b"content-length", b"11") in response.raw_headers
+        assert isinstance(response.raw_headers, tuple)
+    
+    @pytest.mark.asyncio
+    async def test_each_send_gets_own_header_list(self):
+        """Test middleware edits to sent headers do not leak into the response."""
+        response = CachedHTMLResponse(b"<p>page</p>")
+        messages = []
+        
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.start":
+                message["headers"].append((b"set-cookie", b"session=abc"))
+        
+        scope = {"type": "http"}
+        await response(scope, None, send)
+        await response(scope, None, send)
+        
+        assert messages[1]["body"] == b"<p>page</p>"
+        assert messages[2]["headers"].count((b"set-cookie", b"session=abc")) == 1
+        assert (b"set-cookie", b"session=abc") not in response.raw_headers
+
+
+class TestFastJSONResponse:
+    """Tests for FastJSONResponse."""
+    
+    def test_renders_json(self):
+        """Test the content is encoded as compact JSON."""
+        response = FastJSONResponse({"connections": [{"name": "main", "active": True}]})
+        
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"connections": [{"name": "main", "active": True}]}
+    
+    def test_renders_without_orjson(self):
+        """Test the stdlib encoding is used when orjson is missing."""
+        with patch("massir.modules.network_fastapi.api.http.orjson", None):
+            response = FastJSONResponse({"ok": True})
+        
+        assert response.body == b'{"ok":true}'
+
+
+class TestCachedStaticFiles:
+    """Tests for CachedStaticFiles."""
+    
+    @pytest.fixture
+    def static_files(self, tmp_path):
+        """Create CachedStaticFiles over a temp directory."""
+        (tmp_path / "style.css").write_text("body { color: red; }")
+        return CachedStaticFiles(directory=str(tmp_path))
+    
+    @staticmethod
+    def _scope(method="GET", headers=None):
+        return {"type": "http", "method": method, "headers": headers or []}
+    
+    @pytest.mark.asyncio
+    async def test_serves_file_with_etag(self, static_files):
+        """Test first request reads the file and sets an ETag."""
+        response = await static_files.get_response("style.css", self._scope())
+        
+        assert response.status_code == 200
+        assert response.body == b"body { color: red; }"
+        assert response.headers["etag"].startswith('"')
+        assert "style.css" in static_files._cache
+    
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(self, static_files):
+        """Test If-None-Match with the current ETag returns 304."""
+        first = await static_files.get_response("style.css", self._scope())
+        etag = first.headers["etag"]
+        
+        response = await static_files.get_response(
+            "style.css",
+            self._scope(headers=[(b"if-none-match", etag.encode())])
+        )
+        
+        assert response.status_code == 304
+        assert response.body == b""
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_lookup(self, static_files):
+        """Test cached files are served without touching the disk."""
+        await static_files.get_response("style.css", self._scope())
+        
+        with patch.object(static_files, "lookup_path") as lookup:
+            response = await static_files.get_response("style.css", self._scope())
+        
+        lookup.assert_not_called()
+        assert response.status_code == 200
+
+
+class TestCachedTimestampSigner:
+    """Tests for CachedTimestampSigner."""
+    
+    def test_unsign_round_trip(self):
+        """Test a signed value unsigns to its payload."""
+        signer = CachedTimestampSigner("secret")
+        signed = signer.sign(b"payload")
+        
+        assert signer.unsign(signed, max_age=60) == b"payload"
+    
+    def test_repeat_unsign_uses_cache(self):
+        """Test a verified value is not verified again."""
+        signer = CachedTimestampSigner("secret")
+        signed = signer.sign(b"payload")
+        signer.unsign(signed)
+        
+        with patch.object(signer, "verify_signature") as verify:
+            assert signer.unsign(signed) == b"payload"
+        
+        verify.assert_not_called()
+    
+    def test_bad_signature_is_not_cached(self):
+        """Test tampered values raise and are not remembered."""
+        from itsdangerous import BadSignature
+        
+        signer = CachedTimestampSigner("secret")
+        tampered = signer.sign(b"payload") + b"x"
+        
+        with pytest.raises(BadSignature):
+            signer.unsign(tampered)
+        assert signer._verified == {}
+    
+    def test_cached_value_still_expires(self):
+        """Test max_age is enforced on cache hits."""
+        from itsdangerous import SignatureExpired
+        
+        signer = CachedTimestampSigner("secret")
+        signed = signer.sign(b"payload")
+        signer.unsign(signed)
+        
+        one_day_later = time.time() + 24 * 60 * 60
+        with patch("massir.modules.network_fastapi.api.session.time.time", return_value=one_day_later):
+            with pytest.raises(SignatureExpired):
+                signer.unsign(signed, max_age=60)
+    
+    def test_cache_is_bounded(self):
+        """Test the cache is cleared when it reaches maxsize."""
+        signer = CachedTimestampSigner("secret", maxsize=2)
+        for payload in (b"a", b"b", b"c"):
+            signer.unsign(signer.sign(payload))
+        
+        assert len(signer._verified) == 1
 
 
 class TestNetAPI:
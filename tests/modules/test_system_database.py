@@ -2,7 +2,7 @@
 Unit tests for system_database module.
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import asyncio
 
 from massir.modules.system_database import (
@@ -705,3 +705,157 @@ class TestDatabaseService:
     def test_is_connected_false(self, service):
         """Test is_connected returns False when no connections."""
         assert service.is_connected() == False
+    
+    def test_get_cache_stats_single_connection(self, service):
+        """Test get_cache_stats returns only the named connection's stats."""
+        from massir.modules.system_database.core.cache import CacheManager
+        service._cache_manager = CacheManager()
+        service._cache_manager.get_cache("main")._hits = 3
+        service._cache_manager.get_cache("other")
+        
+        stats = service.get_cache_stats("main")
+        
+        assert stats["hits"] == 3
+        assert stats["hit_rate"] == 100
+        assert service.get_cache_stats("missing") == {}
+
+
+class TestCountTables:
+    """Tests for the drivers' count_tables."""
+    
+    @pytest.fixture
+    async def sqlite_manager(self):
+        """Create a SQLite record manager over an in-memory database."""
+        from massir.modules.system_database.drivers.sqlite import SQLitePool, SQLiteRecordManager
+        pool = SQLitePool(DatabaseConfig(name="test", driver="sqlite", pool_min_size=1, pool_max_size=1))
+        await pool.initialize()
+        yield SQLiteRecordManager(pool)
+        await pool.close()
+    
+    @staticmethod
+    def mock_pool(rows):
+        """Create a pool stand-in that records the query and returns rows."""
+        pool = Mock()
+        pool.fetch_all = AsyncMock(return_value=rows)
+        return pool
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_counts(self, sqlite_manager):
+        """Test SQLite counts tables, including names that need quoting."""
+        pool = sqlite_manager._pool
+        await pool.execute("CREATE TABLE users (id INTEGER)")
+        await pool.execute('CREATE TABLE "order items" (id INTEGER)')
+        await pool.execute("INSERT INTO users VALUES (1), (2)")
+        
+        counts = await sqlite_manager.count_tables(["users", "order items"])
+        
+        assert counts == {"users": 2, "order items": 0}
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_batches_queries(self):
+        """Test tables beyond one batch are counted with another query."""
+        from massir.modules.system_database.drivers.sqlite import record
+        pool = self.mock_pool([{"idx": 0, "cnt": 1}])
+        
+        with patch.object(record, "COUNT_TABLES_BATCH", 1):
+            counts = await record.SQLiteRecordManager(pool).count_tables(["a", "b"])
+        
+        assert counts == {"a": 1, "b": 1}
+        assert pool.fetch_all.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_empty_list_runs_no_query(self):
+        """Test counting no tables does not query."""
+        from massir.modules.system_database.drivers.sqlite import SQLiteRecordManager
+        pool = self.mock_pool([])
+        assert await SQLiteRecordManager(pool).count_tables([]) == {}
+        pool.fetch_all.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_postgresql_query(self):
+        """Test PostgreSQL counts in one query with double-quoted names."""
+        from massir.modules.system_database.drivers.postgresql import PostgreSQLRecordManager
+        pool = self.mock_pool([{"idx": 0, "cnt": 3}, {"idx": 1, "cnt": None}])
+        counts = await PostgreSQLRecordManager(pool).count_tables(["users", 'a"b'])
+        
+        pool.fetch_all.assert_awaited_once_with(
+            'SELECT 0 AS idx, COUNT(*) AS cnt FROM "users" UNION ALL '
+            'SELECT 1 AS idx, COUNT(*) AS cnt FROM "a""b"'
+        )
+        assert counts == {"users": 3, 'a"b': 0}
+    
+    @pytest.mark.asyncio
+    async def test_mysql_query(self):
+        """Test MySQL counts in one query with backtick-quoted names."""
+        from massir.modules.system_database.drivers.mysql import MySQLRecordManager
+        pool = self.mock_pool([{"idx": 0, "cnt": 5}])
+        counts = await MySQLRecordManager(pool).count_tables(["a`b"])
+        
+        pool.fetch_all.assert_awaited_once_with(
+            "SELECT 0 AS idx, COUNT(*) AS cnt FROM `a``b`"
+        )
+        assert counts == {"a`b": 5}
+
+
+class TestFindPage:
+    """Tests for the drivers' find_page (keyset pagination)."""
+    
+    @pytest.fixture
+    async def sqlite_manager(self):
+        """Create a SQLite record manager over an in-memory table with ids 1..10."""
+        from massir.modules.system_database.drivers.sqlite import SQLitePool, SQLiteRecordManager
+        pool = SQLitePool(DatabaseConfig(name="test", driver="sqlite", pool_min_size=1, pool_max_size=1))
+        await pool.initialize()
+        await pool.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        for i in range(1, 11):
+            await pool.execute("INSERT INTO items VALUES (?)", (i,))
+        yield SQLiteRecordManager(pool)
+        await pool.close()
+    
+    @staticmethod
+    def mock_pool(rows):
+        """Create a pool stand-in that records the query and returns rows."""
+        pool = Mock()
+        pool.fetch_all = AsyncMock(return_value=rows)
+        return pool
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_first_page(self, sqlite_manager):
+        """Test the first page starts at the lowest key."""
+        rows = await sqlite_manager.find_page("items", "id", limit=3)
+        assert [row["id"] for row in rows] == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_after_key(self, sqlite_manager):
+        """Test a page after a key starts right after it."""
+        rows = await sqlite_manager.find_page("items", "id", after=3, limit=3)
+        assert [row["id"] for row in rows] == [4, 5, 6]
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_before_key_keeps_ascending_order(self, sqlite_manager):
+        """Test a page before a key ends right before it, in key order."""
+        rows = await sqlite_manager.find_page("items", "id", before=7, limit=3)
+        assert [row["id"] for row in rows] == [4, 5, 6]
+    
+    @pytest.mark.asyncio
+    async def test_postgresql_query(self):
+        """Test PostgreSQL pages with $1 placeholders and quoted names."""
+        from massir.modules.system_database.drivers.postgresql import PostgreSQLRecordManager
+        pool = self.mock_pool([{"id": 6}, {"id": 5}])
+        rows = await PostgreSQLRecordManager(pool).find_page("items", "id", before=7, limit=2)
+        
+        pool.fetch_all.assert_awaited_once_with(
+            'SELECT * FROM "items" WHERE "id" < $1 ORDER BY "id" DESC LIMIT 2', (7,)
+        )
+        assert rows == [{"id": 5}, {"id": 6}]
+    
+    @pytest.mark.asyncio
+    async def test_mysql_query(self):
+        """Test MySQL pages with %s placeholders and backtick-quoted names."""
+        from massir.modules.system_database.drivers.mysql import MySQLRecordManager
+        pool = self.mock_pool([{"id": 4}])
+        await MySQLRecordManager(pool).find_page("items", "id", after=3, limit=2)
+        
+        pool.fetch_all.assert_awaited_once_with(
+            "SELECT * FROM `items` WHERE `id` > %s ORDER BY `id` LIMIT 2", (3,)
+        )
@@ -166,6 +166,38 @@ class TestAdvancedLoggerShouldLog:
         
         assert logger._should_log("INFO") == True
         assert logger._should_log("CORE") == True
+    
+    def test_enabled_for_matches_should_log(self):
+        """Test enabled_for reflects the level and tag filters."""
+        mock_config = Mock()
+        mock_config.show_logs.return_value = True
+        mock_config.is_debug.return_value = True
+        mock_config.get_hide_log_levels.return_value = ["DEBUG"]
+        mock_config.get_hide_log_tags.return_value = ["debug"]
+        
+        logger = AdvancedLogger(mock_config)
+        
+        assert logger.enabled_for("INFO") == True
+        assert logger.enabled_for("DEBUG") == False
+        assert logger.enabled_for("INFO", tag="debug") == False
+    
+    def test_log_many_writes_once(self):
+        """Test log_many emits all messages in a single print."""
+        mock_config = Mock()
+        mock_config.show_logs.return_value = True
+        mock_config.is_debug.return_value = True
+        mock_config.get_hide_log_levels.return_value = []
+        mock_config.get_hide_log_tags.return_value = []
+        
+        logger = AdvancedLogger(mock_config)
+        
+        with patch("builtins.print") as mock_print:
+            logger.log_many(["first", "second"], tag="test")
+        
+        mock_print.assert_called_once()
+        output = mock_print.call_args[0][0]
+        assert output.count("[test]") == 2
+        assert output.index("first") < output.index("second")
 
 
 class TestAdvancedLoggerFormatHttpRequest:
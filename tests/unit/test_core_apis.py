@@ -44,6 +44,40 @@ class TestCoreLoggerAPI:
         
         logger = CompleteLogger()
         assert isinstance(logger, CoreLoggerAPI)
+    
+    def test_enabled_for_defaults_to_true(self):
+        """Test that enabled_for is optional and defaults to True."""
+        class CompleteLogger(CoreLoggerAPI):
+            def log(self, message, level="INFO", tag=None, **kwargs):
+                pass
+        
+        logger = CompleteLogger()
+        assert logger.enabled_for("DEBUG", tag="any") == True
+    
+    def test_log_many_defaults_to_log_per_message(self):
+        """Test that log_many calls log once per message in order."""
+        calls = []
+        
+        class CompleteLogger(CoreLoggerAPI):
+            def log(self, message, level="INFO", tag=None, **kwargs):
+                calls.append((message, level, tag))
+        
+        CompleteLogger().log_many(["first", "second"], level="WARNING", tag="t")
+        assert calls == [("first", "WARNING", "t"), ("second", "WARNING", "t")]
+    
+    def test_log_many_skips_disabled_levels(self):
+        """Test that log_many does nothing when enabled_for is False."""
+        calls = []
+        
+        class QuietLogger(CoreLoggerAPI):
+            def log(self, message, level="INFO", tag=None, **kwargs):
+                calls.append(message)
+            
+            def enabled_for(self, level="INFO", tag=None):
+                return False
+        
+        QuietLogger().log_many(["first", "second"])
+        assert calls == []
 
 
 class TestCoreConfigAPI:
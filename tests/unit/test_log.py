@@ -222,6 +222,55 @@ class TestDefaultLogger:
         # Critical levels should be hidden in production
         assert logger._should_log("ERROR") == False
         assert logger._should_log("WARNING") == False
+    
+    def test_enabled_for_matches_should_log(self):
+        """Test enabled_for reflects the level and tag filters."""
+        mock_config = Mock()
+        mock_config.show_logs.return_value = True
+        mock_config.get_hide_log_tags.return_value = ["hidden_tag"]
+        mock_config.get_hide_log_levels.return_value = ["DEBUG"]
+        mock_config.is_debug.return_value = True
+        
+        logger = DefaultLogger(mock_config)
+        
+        assert logger.enabled_for("INFO") == True
+        assert logger.enabled_for("DEBUG") == False
+        assert logger.enabled_for("INFO", tag="hidden_tag") == False
+    
+    def test_log_many_writes_once(self):
+        """Test log_many emits all messages in a single print."""
+        mock_config = Mock()
+        mock_config.show_logs.return_value = True
+        mock_config.get_hide_log_tags.return_value = []
+        mock_config.get_hide_log_levels.return_value = []
+        mock_config.is_debug.return_value = True
+        mock_config.get_system_log_template.return_value = "[{level}] {message}"
+        mock_config.get_system_log_color_code.return_value = "92"
+        mock_config.get_project_name.return_value = "Test"
+        
+        logger = DefaultLogger(mock_config)
+        
+        with patch("builtins.print") as mock_print:
+            logger.log_many(["first", "second"])
+        
+        mock_print.assert_called_once()
+        output = mock_print.call_args[0][0]
+        assert output.index("first") < output.index("second")
+    
+    def test_log_many_respects_filters(self):
+        """Test log_many prints nothing for hidden levels."""
+        mock_config = Mock()
+        mock_config.show_logs.return_value = True
+        mock_config.get_hide_log_tags.return_value = []
+        mock_config.get_hide_log_levels.return_value = ["DEBUG"]
+        mock_config.is_debug.return_value = True
+        
+        logger = DefaultLogger(mock_config)
+        
+        with patch("builtins.print") as mock_print:
+            logger.log_many(["first", "second"], level="DEBUG")
+        
+        mock_print.assert_not_called()
 
 
 class TestLogInternal:
@@ -40,6 +40,21 @@ class TestModuleRegistry:
         
         assert result is None
     
+    def test_get_many_returns_services_in_key_order(self):
+        """Test get_many() returns a tuple ordered like the keys."""
+        registry = ModuleRegistry()
+        registry.set("service1", "value1")
+        registry.set("service2", "value2")
+        
+        assert registry.get_many("service2", "service1") == ("value2", "value1")
+    
+    def test_get_many_returns_none_for_missing(self):
+        """Test get_many() yields None for unregistered keys."""
+        registry = ModuleRegistry()
+        registry.set("service1", "value1")
+        
+        assert registry.get_many("service1", "missing") == ("value1", None)
+    
     def test_has_service_returns_true_for_existing(self):
         """Test has() returns True for existing service."""
         registry = ModuleRegistry()